@@ -1,5 +1,7 @@
 import pygame
-import copy
+from chesscore import Position, make_piece, color_of, square, squares_of, SYMBOLS
+from chesscore.attacks import KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, ROOK_RAYS, BISHOP_RAYS, BETWEEN
+from chesscore.movegen import generate_legal_moves, legal_target_mask
 
 pygame.init()
 # 1. 화면 설정 (턴 표시를 위해 아래 40픽셀 추가)
@@ -49,13 +51,8 @@ def get_piece_at(col, row, current_pieces):
 
 # 길 막힘 검사
 def is_path_clear(c1, r1, c2, r2, current_pieces):
-    step_c = 0 if c1 == c2 else (1 if c2 > c1 else -1)
-    step_r = 0 if r1 == r2 else (1 if r2 > r1 else -1)
-    curr_c, curr_r = c1 + step_c, r1 + step_r
-    while (curr_c, curr_r) != (c2, r2):
-        if get_piece_at(curr_c, curr_r, current_pieces): return False
-        curr_c += step_c; curr_r += step_r
-    return True
+    path = BETWEEN[r1 * 8 + c1][r2 * 8 + c2]  # 두 칸 사이 칸들 (chesscore 에서 미리 계산한 표)
+    return not any(path >> (p["y"] // TILE * 8 + p["x"] // TILE) & 1 for p in current_pieces)
 
 # ---------------------------------------------------
 # 규칙 검사 로직 (체크/체크메이트 포함)
@@ -65,19 +62,20 @@ def can_move_basic(piece, d_col, d_row, current_pieces):
     sym, team = piece["symbol"], piece["team"]
     target = get_piece_at(d_col, d_row, current_pieces)
     if target and target["team"] == team: return False
+    frm, to = row * 8 + col, d_row * 8 + d_col
     
     if sym == "P":
         dir = -1 if team == "white" else 1
         if d_col == col and d_row == row + dir and not target: return True
         if d_col == col and d_row == row + 2*dir and not piece["has_moved"] and not target:
             if not get_piece_at(col, row + dir, current_pieces): return True
-        if abs(d_col - col) == 1 and d_row == row + dir and target: return True
+        if target and PAWN_ATTACKS[team == "black"][frm] >> to & 1: return True
         return False
-    if sym == "R": return (col == d_col or row == d_row) and is_path_clear(col, row, d_col, d_row, current_pieces)
-    if sym == "B": return abs(d_col-col) == abs(d_row-row) and is_path_clear(col, row, d_col, d_row, current_pieces)
-    if sym == "N": return (abs(d_col-col), abs(d_row-row)) in [(1,2),(2,1)]
-    if sym == "Q": return (col == d_col or row == d_row or abs(d_col-col) == abs(d_row-row)) and is_path_clear(col, row, d_col, d_row, current_pieces)
-    if sym == "K": return max(abs(d_col-col), abs(d_row-row)) == 1
+    if sym == "R": return bool(ROOK_RAYS[frm] >> to & 1) and is_path_clear(col, row, d_col, d_row, current_pieces)
+    if sym == "B": return bool(BISHOP_RAYS[frm] >> to & 1) and is_path_clear(col, row, d_col, d_row, current_pieces)
+    if sym == "N": return bool(KNIGHT_ATTACKS[frm] >> to & 1)
+    if sym == "Q": return bool((ROOK_RAYS[frm] | BISHOP_RAYS[frm]) >> to & 1) and is_path_clear(col, row, d_col, d_row, current_pieces)
+    if sym == "K": return bool(KING_ATTACKS[frm] >> to & 1)
     return False
 
 def is_in_check(team, current_pieces):
@@ -87,19 +85,19 @@ def is_in_check(team, current_pieces):
         if p["team"] != team and can_move_basic(p, k_col, k_row, current_pieces): return True
     return False
 
-def is_legal_move(piece, d_col, d_row, current_pieces):
-    if not can_move_basic(piece, d_col, d_row, current_pieces): return False
-    test_pieces = copy.deepcopy(current_pieces)
-    me = next(tp for tp in test_pieces if tp["x"] == piece["x"] and tp["y"] == piece["y"])
-    target = get_piece_at(d_col, d_row, test_pieces)
-    if target: test_pieces.remove(target)
-    me["x"], me["y"] = d_col * TILE, d_row * TILE
-    return not is_in_check(piece["team"], test_pieces)
+# ⭐ chesscore 수 생성기용 국면 만들기 (이 버전은 캐슬링/앙파상이 없습니다)
+def to_position(current_pieces, turn):
+    pos = Position()
+    for p in current_pieces:
+        pos.put_piece(square(p["x"]//TILE, p["y"]//TILE), make_piece(color_of(p["team"]), SYMBOLS.index(p["symbol"])))
+    pos.turn = color_of(turn)
+    return pos
 
 # ---------------------------------------------------
 # 메인 루프
 # ---------------------------------------------------
 selected_piece = None
+selected_targets = 0  # 고른 기물이 갈 수 있는 칸들 (비트보드)
 running = True
 
 while running:
@@ -112,16 +110,15 @@ while running:
 
     # ⭐ [기능 1] 힌트 시스템: 선택된 말이 갈 수 있는 곳에 점 그리기
     if selected_piece:
-        for r in range(8):
-            for c in range(8):
-                if is_legal_move(selected_piece, c, r, pieces):
-                    cx, cy = c * TILE + TILE // 2, r * TILE + TILE // 2
-                    target = get_piece_at(c, r, pieces)
-                    # 잡을 수 있는 적이 있으면 빨간 테두리, 빈 곳은 초록 점
-                    if target:
-                        pygame.draw.circle(screen, (255, 0, 0), (cx, cy), 20, 3)
-                    else:
-                        pygame.draw.circle(screen, (0, 255, 0), (cx, cy), 8)
+        for sq in squares_of(selected_targets):
+            c, r = sq % 8, sq // 8
+            cx, cy = c * TILE + TILE // 2, r * TILE + TILE // 2
+            target = get_piece_at(c, r, pieces)
+            # 잡을 수 있는 적이 있으면 빨간 테두리, 빈 곳은 초록 점
+            if target:
+                pygame.draw.circle(screen, (255, 0, 0), (cx, cy), 20, 3)
+            else:
+                pygame.draw.circle(screen, (0, 255, 0), (cx, cy), 8)
 
     for e in pygame.event.get():
         if e.type == pygame.QUIT: running = False
@@ -132,9 +129,13 @@ while running:
 
             if selected_piece is None:
                 p = get_piece_at(c, r, pieces)
-                if p and p["team"] == current_turn: selected_piece = p
+                if p and p["team"] == current_turn:
+                    # 갈 수 있는 칸은 고를 때 한 번만 구해 두고 힌트 표시와 이동 확인에 같이 씁니다.
+                    selected_piece = p
+                    moves = generate_legal_moves(to_position(pieces, current_turn))
+                    selected_targets = legal_target_mask(moves, square(c, r))
             else:
-                if is_legal_move(selected_piece, c, r, pieces):
+                if selected_targets >> square(c, r) & 1:
                     target = get_piece_at(c, r, pieces)
                     if target: pieces.remove(target)
                     selected_piece["x"], selected_piece["y"] = c*TILE, r*TILE
@@ -1,5 +1,6 @@
 import pygame
 import copy
+from chesscore.attacks import KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, ROOK_RAYS, BISHOP_RAYS, BETWEEN
 
 pygame.init()
 screen_height = 480 + 80 
@@ -61,32 +62,27 @@ def get_piece_at(col, row, current_pieces):
     return None
 
 def is_path_clear(c1, r1, c2, r2, current_pieces):
-    step_c = 0 if c1 == c2 else (1 if c2 > c1 else -1)
-    step_r = 0 if r1 == r2 else (1 if r2 > r1 else -1)
-    curr_c, curr_r = c1 + step_c, r1 + step_r
-    while (curr_c, curr_r) != (c2, r2):
-        if get_piece_at(curr_c, curr_r, current_pieces): return False
-        curr_c += step_c; curr_r += step_r
-    return True
+    path = BETWEEN[r1 * 8 + c1][r2 * 8 + c2]  # 두 칸 사이 칸들 (chesscore 에서 미리 계산한 표)
+    return not any(path >> (p["y"] // TILE * 8 + p["x"] // TILE) & 1 for p in current_pieces)
 
 def can_move_basic(piece, d_col, d_row, current_pieces):
     col, row = piece["x"]//TILE, piece["y"]//TILE
     sym, team = piece["symbol"], piece["team"]
     target = get_piece_at(d_col, d_row, current_pieces)
     if target and target["team"] == team: return False
-    diff_c, diff_r = abs(d_col-col), abs(d_row-row)
+    frm, to = row * 8 + col, d_row * 8 + d_col
     if sym == "P":
         dir = -1 if team == "white" else 1
         if d_col == col and d_row == row + dir and not target: return True
         if d_col == col and d_row == row + 2*dir and not piece["has_moved"] and not target:
             if not get_piece_at(col, row + dir, current_pieces): return True
-        if diff_c == 1 and d_row == row + dir and target: return True
+        if target and PAWN_ATTACKS[team == "black"][frm] >> to & 1: return True
         return False
-    if sym == "R": return (col == d_col or row == d_row) and is_path_clear(col, row, d_col, d_row, current_pieces)
-    if sym == "B": return diff_c == diff_r and is_path_clear(col, row, d_col, d_row, current_pieces)
-    if sym == "N": return (diff_c, diff_r) in [(1,2),(2,1)]
-    if sym == "Q": return (col == d_col or row == d_row or diff_c == diff_r) and is_path_clear(col, row, d_col, d_row, current_pieces)
-    if sym == "K": return max(diff_c, diff_r) == 1
+    if sym == "R": return bool(ROOK_RAYS[frm] >> to & 1) and is_path_clear(col, row, d_col, d_row, current_pieces)
+    if sym == "B": return bool(BISHOP_RAYS[frm] >> to & 1) and is_path_clear(col, row, d_col, d_row, current_pieces)
+    if sym == "N": return bool(KNIGHT_ATTACKS[frm] >> to & 1)
+    if sym == "Q": return bool((ROOK_RAYS[frm] | BISHOP_RAYS[frm]) >> to & 1) and is_path_clear(col, row, d_col, d_row, current_pieces)
+    if sym == "K": return bool(KING_ATTACKS[frm] >> to & 1)
     return False
 
 def is_in_check(team, current_pieces):
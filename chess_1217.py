@@ -1,5 +1,6 @@
 import pygame
 import copy
+from chesscore.attacks import KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, ROOK_RAYS, BISHOP_RAYS, BETWEEN
 
 pygame.init()
 screen_height = 480 + 40 
@@ -51,38 +52,33 @@ def get_piece_at(col, row, current_pieces):
     return None
 
 def is_path_clear(c1, r1, c2, r2, current_pieces):
-    step_c = 0 if c1 == c2 else (1 if c2 > c1 else -1)
-    step_r = 0 if r1 == r2 else (1 if r2 > r1 else -1)
-    curr_c, curr_r = c1 + step_c, r1 + step_r
-    while (curr_c, curr_r) != (c2, r2):
-        if get_piece_at(curr_c, curr_r, current_pieces): return False
-        curr_c += step_c
-        curr_r += step_r
-    return True
+    path = BETWEEN[r1 * 8 + c1][r2 * 8 + c2]  # 두 칸 사이 칸들 (chesscore 에서 미리 계산한 표)
+    return not any(path >> (p["y"] // TILE * 8 + p["x"] // TILE) & 1 for p in current_pieces)
 
 def can_move_basic(piece, d_col, d_row, current_pieces):
     col, row = piece["x"]//TILE, piece["y"]//TILE
     sym, team = piece["symbol"], piece["team"]
     target = get_piece_at(d_col, d_row, current_pieces)
     if target and target["team"] == team: return False
+    frm, to = row * 8 + col, d_row * 8 + d_col
     
     if sym == "P":
         dir = -1 if team == "white" else 1
         if d_col == col and d_row == row + dir and not target: return True
         if d_col == col and d_row == row + 2*dir and not piece["has_moved"] and not target:
             if not get_piece_at(col, row + dir, current_pieces): return True
-        if abs(d_col - col) == 1 and d_row == row + dir and target: return True
+        if target and PAWN_ATTACKS[team == "black"][frm] >> to & 1: return True
         return False
     if sym == "R":
-        return (col == d_col or row == d_row) and is_path_clear(col, row, d_col, d_row, current_pieces)
+        return bool(ROOK_RAYS[frm] >> to & 1) and is_path_clear(col, row, d_col, d_row, current_pieces)
     if sym == "B":
-        return abs(d_col-col) == abs(d_row-row) and is_path_clear(col, row, d_col, d_row, current_pieces)
+        return bool(BISHOP_RAYS[frm] >> to & 1) and is_path_clear(col, row, d_col, d_row, current_pieces)
     if sym == "N":
-        return (abs(d_col-col), abs(d_row-row)) in [(1,2),(2,1)]
+        return bool(KNIGHT_ATTACKS[frm] >> to & 1)
     if sym == "Q":
-        return (col == d_col or row == d_row or abs(d_col-col) == abs(d_row-row)) and is_path_clear(col, row, d_col, d_row, current_pieces)
+        return bool((ROOK_RAYS[frm] | BISHOP_RAYS[frm]) >> to & 1) and is_path_clear(col, row, d_col, d_row, current_pieces)
     if sym == "K":
-        if max(abs(d_col-col), abs(d_row-row)) == 1: return True
+        if KING_ATTACKS[frm] >> to & 1: return True
         # 캐슬링 기본 조건 (왕이 2칸 이동)
         if not piece["has_moved"] and d_row == row and abs(d_col - col) == 2:
             return True # 상세 체크는 is_legal_move에서 수행
@@ -0,0 +1,28 @@
+"""pygame 없이 import 할 수 있는 체스 규칙 코어."""
+
+from .position import (
+    WHITE, BLACK, COLOR_NAMES, EMPTY, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, SYMBOLS,
+    WHITE_KINGSIDE, WHITE_QUEENSIDE, BLACK_KINGSIDE, BLACK_QUEENSIDE, ALL_CASTLING,
+    Position, make_piece, piece_type, piece_color, square, square_col, square_row, color_of,
+    square_name, parse_square, is_dark_square, MATERIAL_KEYS,
+    MOVE_DOUBLE_PUSH, MOVE_CASTLE, MOVE_EN_PASSANT, move_flags,
+)
+from .attacks import (
+    bit, popcount, squares_of, KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, PAWN_PUSHES, PAWN_DOUBLE_PUSHES,
+    DIRECTIONS, RAYS, ROOK_RAYS, BISHOP_RAYS, BETWEEN, rook_attacks, bishop_attacks, queen_attacks,
+)
+from .rules import (
+    PROMOTION_PIECES, attackers_to, is_square_attacked, is_in_check, is_promotion,
+)
+from .movegen import (
+    encode_move, move_from, move_to, move_flag, move_promotion, move_name, iter_legal_moves,
+    generate_legal_moves, generate_captures, has_legal_move, find_move, is_legal_move, legal_target_mask, between, checkers_and_pins,
+)
+from .zobrist import compute_key, RepetitionTable
+from .material import material_count, bishop_counts, make_material_key, is_dead_draw, DEAD_DRAW_KEYS
+from .fen import START_FEN, parse_fen, to_fen, parse_epd, read_epd, to_epd, fen_to_pieces, pieces_to_fen
+from .game import Game, PositionStatus
+from .compact import CompactPosition
+from .frozen import FrozenPosition
+from .evaluate import PIECE_VALUES, evaluate
+from .packed import PACKED_SIZE, pack_position, unpack_position, pack_batch, unpack_batch, unpack_boards
@@ -0,0 +1,143 @@
+# --- 비트보드 공격 테이블 ---
+# 비트보드는 파이썬 정수 하나로 64칸을 표현합니다. 비트 번호 = 칸 번호 (a8 = 0, h1 = 63).
+# 나이트/킹/폰 공격, 폰 전진, 8방향 광선(RAYS), 두 칸 사이(BETWEEN)는 import 할 때 칸별로 미리 계산하고,
+# 슬라이딩 기물(룩/비숍)은 "관련 칸 점유 상태 -> 공격 칸" 테이블을 칸별 dict 로 찾습니다.
+# (매직 비트보드의 곱셈 해시 대신 파이썬 dict 해시를 쓰고, 처음 보는 점유 상태만 광선을 따라가 채웁니다.)
+
+FULL = (1 << 64) - 1
+
+
+def bit(sq):
+    return 1 << sq
+
+def lsb(b):
+    return (b & -b).bit_length() - 1
+
+def popcount(b):
+    return bin(b).count("1")
+
+def squares_of(b):
+    """비트보드에 켜진 칸 번호를 작은 번호부터 돌려줍니다."""
+    result = []
+    while b:
+        low = b & -b
+        result.append(low.bit_length() - 1)
+        b ^= low
+    return result
+
+
+def _on_board(col, row):
+    return 0 <= col < 8 and 0 <= row < 8
+
+def _offset_table(offsets):
+    table = []
+    for sq in range(64):
+        col, row = sq & 7, sq >> 3
+        b = 0
+        for dc, dr in offsets:
+            if _on_board(col + dc, row + dr):
+                b |= bit((row + dr) * 8 + col + dc)
+        table.append(b)
+    return table
+
+
+KNIGHT_ATTACKS = _offset_table([(1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2)])
+KING_ATTACKS = _offset_table([(1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)])
+# 백 폰은 row 가 줄어드는 쪽(위), 흑 폰은 row 가 늘어나는 쪽(아래)을 공격합니다.
+PAWN_ATTACKS = (
+    _offset_table([(-1, -1), (1, -1)]),
+    _offset_table([(-1, 1), (1, 1)]),
+)
+
+ROOK_DIRECTIONS = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+BISHOP_DIRECTIONS = [(1, -1), (1, 1), (-1, 1), (-1, -1)]
+DIRECTIONS = ROOK_DIRECTIONS + BISHOP_DIRECTIONS  # RAYS 의 방향 순서: 룩 방향 4개, 비숍 방향 4개
+
+
+def _ray(sq, dc, dr):
+    """sq 에서 (dc, dr) 방향으로 가까운 칸부터 보드 끝까지."""
+    col, row = sq & 7, sq >> 3
+    result = []
+    c, r = col + dc, row + dr
+    while _on_board(c, r):
+        result.append(r * 8 + c)
+        c += dc; r += dr
+    return tuple(result)
+
+
+# RAYS[sq][d] = d 번째 방향의 칸들 (가까운 칸부터). 빈 방향은 빈 튜플.
+RAYS = [tuple(_ray(sq, dc, dr) for dc, dr in DIRECTIONS) for sq in range(64)]
+# 빈 보드에서 룩/비숍이 닿는 칸 (같은 줄에 있는지 확인할 때 씁니다)
+ROOK_RAYS = [0] * 64
+BISHOP_RAYS = [0] * 64
+# BETWEEN[a][b] = 같은 줄의 두 칸 사이 칸들 (양 끝 제외). 같은 줄이 아니거나 붙어 있으면 0.
+BETWEEN = [[0] * 64 for _ in range(64)]
+for _sq in range(64):
+    for _d, _squares in enumerate(RAYS[_sq]):
+        _mask = 0
+        for _s in _squares:
+            BETWEEN[_sq][_s] = _mask
+            _mask |= 1 << _s
+        if _d < 4: ROOK_RAYS[_sq] |= _mask
+        else: BISHOP_RAYS[_sq] |= _mask
+del _sq, _d, _squares, _mask, _s
+
+
+def _slide(sq, occ, directions):
+    """sq 에서 각 방향으로 첫 번째 기물(포함)까지 걸어가며 공격 칸을 모읍니다."""
+    rays = RAYS[sq]
+    b = 0
+    for d in directions:
+        for s in rays[d]:
+            b |= 1 << s
+            if occ >> s & 1: break
+    return b
+
+def _relevant_mask(sq, directions):
+    """가장자리 칸을 뺀 광선 칸들. 가장자리 칸의 점유 여부는 공격 범위에 영향을 주지 않습니다."""
+    rays = RAYS[sq]
+    b = 0
+    for d in directions:
+        for s in rays[d][:-1]:
+            b |= 1 << s
+    return b
+
+
+_ROOK_DIRS = (0, 1, 2, 3)
+_BISHOP_DIRS = (4, 5, 6, 7)
+ROOK_MASKS = [_relevant_mask(sq, _ROOK_DIRS) for sq in range(64)]
+BISHOP_MASKS = [_relevant_mask(sq, _BISHOP_DIRS) for sq in range(64)]
+_ROOK_TABLES = [{} for _ in range(64)]
+_BISHOP_TABLES = [{} for _ in range(64)]
+
+
+def rook_attacks(sq, occ):
+    key = occ & ROOK_MASKS[sq]
+    table = _ROOK_TABLES[sq]
+    att = table.get(key)
+    if att is None:
+        att = table[key] = _slide(sq, key, _ROOK_DIRS)
+    return att
+
+def bishop_attacks(sq, occ):
+    key = occ & BISHOP_MASKS[sq]
+    table = _BISHOP_TABLES[sq]
+    att = table.get(key)
+    if att is None:
+        att = table[key] = _slide(sq, key, _BISHOP_DIRS)
+    return att
+
+def queen_attacks(sq, occ):
+    return rook_attacks(sq, occ) | bishop_attacks(sq, occ)
+
+
+# 랭크 마스크 (row 기준)
+ROW_MASKS = [0xFF << (8 * row) for row in range(8)]
+PAWN_START_ROW = (6, 1)
+PAWN_PROMOTION_ROW = (0, 7)
+PAWN_STEP = (-8, 8)
+# PAWN_PUSHES[color][sq] = 한 칸 전진 칸, PAWN_DOUBLE_PUSHES[color][sq] = 시작 줄에서 두 칸 전진 칸 (없으면 0)
+PAWN_PUSHES = tuple([1 << (sq + PAWN_STEP[color]) if 0 <= sq + PAWN_STEP[color] < 64 else 0 for sq in range(64)]
+                    for color in (0, 1))
+PAWN_DOUBLE_PUSHES = tuple([1 << (sq + 2 * PAWN_STEP[color]) if sq >> 3 == PAWN_START_ROW[color] else 0
+                            for sq in range(64)] for color in (0, 1))
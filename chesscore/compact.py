@@ -0,0 +1,64 @@
+# --- 작은 국면 레코드 ---
+# 분석/중복 제거/캐시처럼 국면을 수백만 개 들고 있어야 할 때 쓰는 불변 국면.
+# bytes 하나(70바이트)에 모두 담기 때문에 그대로 해시하고 비교할 수 있고, dict/set 의 키로 쓸 수 있습니다.
+#
+#   0..63   칸별 기물 코드 (Position.board 와 같음)
+#   64..69  차례/캐슬링/앙파상/수 카운트 (position.pack_state, packed 의 24..29 와 같은 배치)
+
+from .position import WHITE, STATE_SIZE, Position, pack_state, unpack_state
+
+SIZE = 64 + STATE_SIZE
+
+
+class CompactPosition:
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        if len(data) != SIZE:
+            raise ValueError(f"CompactPosition 은 {SIZE}바이트여야 합니다: {len(data)}")
+        self.data = bytes(data)
+
+    @classmethod
+    def from_position(cls, pos):
+        return cls(bytes(pos.board)
+                   + pack_state(pos.turn, pos.castling, pos.ep_square, pos.halfmove_clock, pos.fullmove_number))
+
+    def to_position(self):
+        """수를 둘 수 있는 Position 으로 되돌립니다 (되돌리기 기록은 비어 있음)."""
+        return Position.from_board(self.data[:64], *unpack_state(self.data[64:]))
+
+    @property
+    def board(self):
+        return self.data[:64]
+
+    @property
+    def turn(self):
+        return self.data[64] & 1
+
+    @property
+    def castling(self):
+        return unpack_state(self.data[64:])[1]
+
+    @property
+    def ep_square(self):
+        return unpack_state(self.data[64:])[2]
+
+    @property
+    def halfmove_clock(self):
+        return unpack_state(self.data[64:])[3]
+
+    @property
+    def fullmove_number(self):
+        return unpack_state(self.data[64:])[4]
+
+    def piece_at(self, sq):
+        return self.data[sq]
+
+    def __eq__(self, other):
+        return isinstance(other, CompactPosition) and self.data == other.data
+
+    def __hash__(self):
+        return hash(self.data)
+
+    def __repr__(self):
+        return f"CompactPosition({'white' if self.turn == WHITE else 'black'} to move, {self.data.hex()})"
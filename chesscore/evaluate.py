@@ -0,0 +1,119 @@
+# --- 정적 평가 ---
+# 기물 값 + 칸별 보너스(piece-square table). 점수는 센티폰 단위, 차례인 쪽 기준 (negamax 용).
+# 표는 백 기준으로 a8..h8, ..., a1..h1 순서(= 칸 번호 순서)이고, 흑은 위아래를 뒤집어 씁니다.
+# 기물 코드와 칸으로 바로 찾을 수 있게 PIECE_SQUARE[pc][sq] 에 기물 값까지 더해 둡니다 (흑은 음수).
+#
+# see(pos, move) 는 한 칸에서 서로 잡고 잡히기를 끝까지 했을 때의 기물 득실 (static exchange evaluation).
+# 수를 실제로 두어 보지 않고, 도착 칸을 공격하는 양쪽 기물을 attackers_to 로 구해 싼 기물부터 번갈아 씁니다.
+
+from .position import WHITE, BLACK, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, MOVE_EN_PASSANT, make_piece
+from .rules import attackers_to
+
+PIECE_VALUES = [0, 100, 320, 330, 500, 900, 0]  # 종류별 (킹은 잡히지 않으므로 0)
+_SEE_VALUES = PIECE_VALUES[:KING] + [20000]  # 교환에서 킹은 마지막에, 잡히면 안 되는 기물로
+
+_TABLES = {
+    PAWN: [
+          0,   0,   0,   0,   0,   0,   0,   0,
+         50,  50,  50,  50,  50,  50,  50,  50,
+         10,  10,  20,  30,  30,  20,  10,  10,
+          5,   5,  10,  25,  25,  10,   5,   5,
+          0,   0,   0,  20,  20,   0,   0,   0,
+          5,  -5, -10,   0,   0, -10,  -5,   5,
+          5,  10,  10, -20, -20,  10,  10,   5,
+          0,   0,   0,   0,   0,   0,   0,   0],
+    KNIGHT: [
+        -50, -40, -30, -30, -30, -30, -40, -50,
+        -40, -20,   0,   0,   0,   0, -20, -40,
+        -30,   0,  10,  15,  15,  10,   0, -30,
+        -30,   5,  15,  20,  20,  15,   5, -30,
+        -30,   0,  15,  20,  20,  15,   0, -30,
+        -30,   5,  10,  15,  15,  10,   5, -30,
+        -40, -20,   0,   5,   5,   0, -20, -40,
+        -50, -40, -30, -30, -30, -30, -40, -50],
+    BISHOP: [
+        -20, -10, -10, -10, -10, -10, -10, -20,
+        -10,   0,   0,   0,   0,   0,   0, -10,
+        -10,   0,   5,  10,  10,   5,   0, -10,
+        -10,   5,   5,  10,  10,   5,   5, -10,
+        -10,   0,  10,  10,  10,  10,   0, -10,
+        -10,  10,  10,  10,  10,  10,  10, -10,
+        -10,   5,   0,   0,   0,   0,   5, -10,
+        -20, -10, -10, -10, -10, -10, -10, -20],
+    ROOK: [
+          0,   0,   0,   0,   0,   0,   0,   0,
+          5,  10,  10,  10,  10,  10,  10,   5,
+         -5,   0,   0,   0,   0,   0,   0,  -5,
+         -5,   0,   0,   0,   0,   0,   0,  -5,
+         -5,   0,   0,   0,   0,   0,   0,  -5,
+         -5,   0,   0,   0,   0,   0,   0,  -5,
+         -5,   0,   0,   0,   0,   0,   0,  -5,
+          0,   0,   0,   5,   5,   0,   0,   0],
+    QUEEN: [
+        -20, -10, -10,  -5,  -5, -10, -10, -20,
+        -10,   0,   0,   0,   0,   0,   0, -10,
+        -10,   0,   5,   5,   5,   5,   0, -10,
+         -5,   0,   5,   5,   5,   5,   0,  -5,
+          0,   0,   5,   5,   5,   5,   0,  -5,
+        -10,   5,   5,   5,   5,   5,   0, -10,
+        -10,   0,   5,   0,   0,   0,   0, -10,
+        -20, -10, -10,  -5,  -5, -10, -10, -20],
+    KING: [
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -20, -30, -30, -40, -40, -30, -30, -20,
+        -10, -20, -20, -20, -20, -20, -20, -10,
+         20,  20,   0,   0,   0,   0,  20,  20,
+         20,  30,  10,   0,   0,  10,  30,  20],
+}
+
+PIECE_SQUARE = [[0] * 64 for _ in range(16)]
+for _ptype, _table in _TABLES.items():
+    for _sq in range(64):
+        PIECE_SQUARE[make_piece(WHITE, _ptype)][_sq] = PIECE_VALUES[_ptype] + _table[_sq]
+        PIECE_SQUARE[make_piece(BLACK, _ptype)][_sq] = -(PIECE_VALUES[_ptype] + _table[_sq ^ 56])
+del _ptype, _table, _sq
+
+
+def evaluate(pos):
+    """차례인 쪽에서 본 점수 (센티폰)."""
+    pst = PIECE_SQUARE
+    score = 0
+    for sq, pc in enumerate(pos.board):
+        if pc: score += pst[pc][sq]
+    return -score if pos.turn else score
+
+
+def see(pos, move):
+    """move 로 시작하는 도착 칸의 교환을 양쪽이 가장 좋게 끝냈을 때, 차례인 쪽이 얻는 기물 값."""
+    from_sq, to_sq, flag = move & 63, (move >> 6) & 63, move >> 12
+    board, bbs = pos.board, pos.bitboards
+    occ = (pos.occupied[0] | pos.occupied[1]) ^ (1 << from_sq)
+    if flag == MOVE_EN_PASSANT:
+        gain = [PIECE_VALUES[PAWN]]
+        occ ^= 1 << (to_sq + (8 if pos.turn == WHITE else -8))
+    else:
+        gain = [PIECE_VALUES[board[to_sq] & 7]]
+    on_square = board[from_sq] & 7  # 지금 도착 칸에 있는 (다음에 잡힐) 기물 종류
+    if 2 <= flag <= 5:  # 승진
+        gain[0] += PIECE_VALUES[flag] - PIECE_VALUES[PAWN]
+        on_square = flag
+    side = pos.turn ^ 1
+    while True:
+        # 이미 쓴 기물은 occ 에서 지웠으므로, 그 뒤에 있던 룩/비숍/퀸이 광선으로 드러납니다.
+        attackers = attackers_to(pos, to_sq, side, occ) & occ
+        if not attackers: break
+        base = side << 3
+        for ptype in range(PAWN, KING + 1):
+            b = attackers & bbs[base | ptype]
+            if b: break
+        if ptype == KING and attackers_to(pos, to_sq, side ^ 1, occ) & occ: break  # 지켜지는 칸은 킹이 못 잡습니다
+        gain.append(_SEE_VALUES[on_square] - gain[-1])
+        on_square = ptype
+        occ ^= b & -b
+        side ^= 1
+    for i in range(len(gain) - 1, 0, -1):
+        gain[i - 1] = -max(-gain[i - 1], gain[i])
+    return gain[0]
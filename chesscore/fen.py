@@ -0,0 +1,208 @@
+# --- FEN / EPD 읽기/쓰기 ---
+# 예: "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+# 배치 필드는 숫자를 빈 칸 문자로 펼친 뒤 bytes.translate 한 번으로 64칸 기물 코드로 바꿉니다.
+# 문자 하나씩 파이썬 루프를 돌지 않으므로 EPD 수백만 줄도 빠르게 읽을 수 있습니다.
+#
+# 말 dict ({"symbol", "team", "x", "y", "has_moved"}) 를 쓰는 버전과 주고받을 때는
+# 캐슬링 권한을 킹/룩의 has_moved 로 풀고 (fen_to_pieces), 반대로 has_moved 에서 권한을 만듭니다 (pieces_to_fen).
+
+from .position import (
+    WHITE, BLACK, PAWN, ROOK, KING, SYMBOLS, COLOR_NAMES, EP_ROW,
+    WHITE_KINGSIDE, WHITE_QUEENSIDE, BLACK_KINGSIDE, BLACK_QUEENSIDE,
+    Position, make_piece, square_name, square,
+)
+from .rules import is_in_check
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+_CASTLING_LETTERS = (("K", WHITE_KINGSIDE), ("Q", WHITE_QUEENSIDE), ("k", BLACK_KINGSIDE), ("q", BLACK_QUEENSIDE))
+_CASTLING_RIGHTS = {letter: right for letter, right in _CASTLING_LETTERS}
+_CASTLING_TEXT = ["".join(letter for letter, right in _CASTLING_LETTERS if rights & right) or "-"
+                  for rights in range(16)]
+# 숫자 -> 그 개수만큼의 빈 칸 문자 "."
+_EXPAND_DIGITS = str.maketrans({str(n): "." * n for n in range(1, 9)})
+# 기물 문자 -> 기물 코드, 빈 칸 "." -> 0. 나머지 문자는 0xFF 로 바꿔 잘못된 입력을 찾아냅니다.
+_PIECE_CODES = bytes(
+    0 if ch == "." else make_piece(WHITE, SYMBOLS.index(ch)) if ch in "PNBRQK"
+    else make_piece(BLACK, SYMBOLS.index(ch.upper())) if ch in "pnbrqk" else 0xFF
+    for ch in map(chr, range(256)))
+_PIECE_LETTERS = ["."] * 16
+for _ptype in range(1, 7):
+    _PIECE_LETTERS[make_piece(WHITE, _ptype)] = SYMBOLS[_ptype]
+    _PIECE_LETTERS[make_piece(BLACK, _ptype)] = SYMBOLS[_ptype].lower()
+del _ptype
+# 차례별로 올 수 있는 앙파상 칸: 백 차례면 6랭크, 흑 차례면 3랭크
+_EP_SQUARES = [{square_name(EP_ROW[color] * 8 + col): EP_ROW[color] * 8 + col for col in range(8)}
+               for color in (WHITE, BLACK)]
+# 캐슬링 권한 -> 그 권한이 남아 있으려면 움직이지 않았어야 하는 (킹 칸, 룩 칸)
+_CASTLING_SQUARES = {
+    WHITE_KINGSIDE: (square(4, 7), square(7, 7)), WHITE_QUEENSIDE: (square(4, 7), square(0, 7)),
+    BLACK_KINGSIDE: (square(4, 0), square(7, 0)), BLACK_QUEENSIDE: (square(4, 0), square(0, 0)),
+}
+_CASTLING_COLOR = {WHITE_KINGSIDE: WHITE, WHITE_QUEENSIDE: WHITE, BLACK_KINGSIDE: BLACK, BLACK_QUEENSIDE: BLACK}
+_BACK_RANKS = bytes(range(8)) + bytes(range(56, 64))
+
+
+def _parse_placement(text):
+    rows = text.translate(_EXPAND_DIGITS).split("/")
+    if len(rows) != 8:
+        raise ValueError(f"FEN 배치는 8줄이어야 합니다: {text!r}")
+    for row in rows:
+        if len(row) != 8:
+            raise ValueError(f"FEN 한 줄은 8칸이어야 합니다: {row!r}")
+    board = "".join(rows).encode("latin-1", "replace").translate(_PIECE_CODES)
+    if 0xFF in board:
+        raise ValueError(f"FEN 배치를 읽을 수 없습니다: {text!r}")
+    for color in (WHITE, BLACK):
+        if board.count(make_piece(color, KING)) != 1:
+            raise ValueError(f"FEN 에 {COLOR_NAMES[color]} 킹이 하나여야 합니다: {text!r}")
+    if any(board[sq] & 7 == PAWN for sq in _BACK_RANKS):
+        raise ValueError(f"폰은 1랭크나 8랭크에 있을 수 없습니다: {text!r}")
+    return board
+
+
+def _castling_rights(board, rights):
+    """킹이나 룩이 제자리에 없는 캐슬링 권한은 지웁니다."""
+    for right, (king_sq, rook_sq) in _CASTLING_SQUARES.items():
+        color = _CASTLING_COLOR[right]
+        if rights & right and (board[king_sq] != make_piece(color, KING)
+                               or board[rook_sq] != make_piece(color, ROOK)):
+            rights &= ~right
+    return rights
+
+
+def _position_from_fields(fields, halfmove_clock=0, fullmove_number=1):
+    board = _parse_placement(fields[0])
+    if fields[1] not in ("w", "b"):
+        raise ValueError(f"차례는 w 또는 b 여야 합니다: {fields[1]!r}")
+    turn = WHITE if fields[1] == "w" else BLACK
+    castling = 0
+    if fields[2] != "-":
+        for letter in fields[2]:
+            if letter not in _CASTLING_RIGHTS:
+                raise ValueError(f"캐슬링 필드를 읽을 수 없습니다: {fields[2]!r}")
+            castling |= _CASTLING_RIGHTS[letter]
+    if fields[3] == "-":
+        ep_square = None
+    elif fields[3] in _EP_SQUARES[turn]:
+        ep_square = _EP_SQUARES[turn][fields[3]]
+        # 바로 전에 상대 폰이 두 칸 전진했어야 합니다: 앙파상 칸 너머에 상대 폰, 그 칸과 출발 칸은 비어 있음.
+        step = 8 if turn == WHITE else -8
+        if (board[ep_square + step] != make_piece(turn ^ 1, PAWN)
+                or board[ep_square] or board[ep_square - step]):
+            raise ValueError(f"앙파상 칸 뒤에 두 칸 전진한 폰이 없습니다: {fields[3]!r}")
+    else:
+        raise ValueError(f"앙파상 칸을 읽을 수 없습니다 (차례와 랭크가 맞아야 합니다): {fields[3]!r}")
+    if halfmove_clock < 0 or fullmove_number < 1:
+        raise ValueError(f"수 카운트가 범위를 벗어났습니다 (반수 >= 0, 수 번호 >= 1): "
+                         f"{halfmove_clock} {fullmove_number}")
+    pos = Position.from_board(board, turn, _castling_rights(board, castling), ep_square,
+                              halfmove_clock, fullmove_number)
+    if is_in_check(pos, turn ^ 1):
+        raise ValueError(f"차례가 아닌 쪽의 킹이 체크 상태입니다: {' '.join(fields[:4])!r}")
+    return pos
+
+
+def parse_fen(fen):
+    fields = fen.split()
+    if len(fields) < 4:
+        raise ValueError(f"FEN 필드가 부족합니다: {fen!r}")
+    try:
+        halfmove_clock = int(fields[4]) if len(fields) > 4 else 0
+        fullmove_number = int(fields[5]) if len(fields) > 5 else 1
+    except ValueError:
+        raise ValueError(f"FEN 수 카운트를 읽을 수 없습니다: {fen!r}") from None
+    return _position_from_fields(fields, halfmove_clock, fullmove_number)
+
+
+def to_fen(pos):
+    board = pos.board
+    rows = []
+    for row in range(0, 64, 8):
+        text = "".join([_PIECE_LETTERS[pc] for pc in board[row:row + 8]])
+        for n in range(8, 0, -1):
+            text = text.replace("." * n, str(n))
+        rows.append(text)
+    ep = "-" if pos.ep_square is None else square_name(pos.ep_square)
+    return (f"{'/'.join(rows)} {'w' if pos.turn == WHITE else 'b'} {_CASTLING_TEXT[pos.castling]} {ep} "
+            f"{pos.halfmove_clock} {pos.fullmove_number}")
+
+
+# --- EPD ---
+# FEN 앞 네 필드 + "bm e4; id \"이름\";" 같은 연산들. 수 카운트는 hmvc / fmvn 연산으로 줄 수 있습니다.
+
+def parse_epd(line):
+    """EPD 한 줄 -> (Position, {연산 이름: 값 문자열})."""
+    fields = line.split(None, 4)
+    if len(fields) < 4:
+        raise ValueError(f"EPD 필드가 부족합니다: {line!r}")
+    ops = {}
+    if len(fields) > 4:
+        for op in fields[4].split(";"):
+            op = op.strip()
+            if not op: continue
+            name, _, value = op.partition(" ")
+            ops[name] = value.strip().strip('"')
+    try:
+        halfmove_clock = int(ops.get("hmvc", 0))
+        fullmove_number = int(ops.get("fmvn", 1))
+    except ValueError:
+        raise ValueError(f"EPD 수 카운트를 읽을 수 없습니다: {line!r}") from None
+    return _position_from_fields(fields, halfmove_clock, fullmove_number), ops
+
+
+def read_epd(lines):
+    """EPD 줄들(파일 객체 등)을 읽으며 (Position, 연산) 을 하나씩 내놓습니다. 빈 줄과 # 주석은 건너뜁니다."""
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield parse_epd(line)
+
+
+def to_epd(pos, ops=None):
+    fen = to_fen(pos).rsplit(" ", 2)[0]
+    if not ops: return fen
+    return fen + " " + " ".join(f"{name} {value};" if value else f"{name};" for name, value in ops.items())
+
+
+# --- 말 dict 목록과 주고받기 (chess_13 ~ chess_15 등) ---
+
+_PAWN_START_ROW = (6, 1)
+
+
+def fen_to_pieces(fen, tile=60):
+    """FEN -> (말 dict 목록, 차례 "white"/"black").
+
+    has_moved 는 캐슬링 권한에서 풀어 냅니다: 권한이 남은 킹과 그 룩, 시작 줄의 폰만 움직이지 않은 것으로 봅니다.
+    """
+    pos = parse_fen(fen)
+    unmoved = set()
+    for right, squares in _CASTLING_SQUARES.items():
+        if pos.castling & right: unmoved.update(squares)
+    pieces = []
+    for sq, pc in enumerate(pos.board):
+        if not pc: continue
+        ptype, color = pc & 7, pc >> 3
+        if ptype == PAWN: moved = sq >> 3 != _PAWN_START_ROW[color]
+        else: moved = sq not in unmoved
+        pieces.append({"symbol": SYMBOLS[ptype], "team": COLOR_NAMES[color],
+                       "x": (sq & 7) * tile, "y": (sq >> 3) * tile, "has_moved": moved})
+    return pieces, COLOR_NAMES[pos.turn]
+
+
+def pieces_to_fen(pieces, turn, tile=60, ep_square=None, halfmove_clock=0, fullmove_number=1):
+    """말 dict 목록 -> FEN. 킹과 룩이 제자리에 있고 둘 다 has_moved 가 False 인 쪽만 캐슬링 권한을 줍니다."""
+    board = bytearray(64)
+    unmoved = set()
+    for p in pieces:
+        sq = square(p["x"] // tile, p["y"] // tile)
+        ptype = SYMBOLS.index(p["symbol"])
+        board[sq] = make_piece(WHITE if p["team"] == "white" else BLACK, ptype)
+        if ptype in (KING, ROOK) and not p["has_moved"]: unmoved.add(sq)
+    castling = 0
+    for right, (king_sq, rook_sq) in _CASTLING_SQUARES.items():
+        if king_sq in unmoved and rook_sq in unmoved: castling |= right
+    castling = _castling_rights(board, castling)
+    pos = Position.from_board(board, WHITE if turn == "white" else BLACK, castling, ep_square,
+                              halfmove_clock, fullmove_number)
+    return to_fen(pos)
@@ -0,0 +1,128 @@
+# --- 불변 국면 (분석 트리용) ---
+# 변화수를 따라가거나 무르기/엔진 PV 를 훑을 때, 가지마다 국면 전체를 복사하지 않도록
+# play(move) 가 새 FrozenPosition 을 돌려주고 부모와 나머지를 모두 공유합니다.
+#
+# 노드 하나에는 (부모, 수, 키, 깊이) 만 들어 있어 트리 메모리는 둔 수의 개수에 비례합니다.
+# 실제 보드는 트리 전체가 Position 하나(커서)를 같이 쓰고, 어떤 노드의 보드가 필요할 때
+# 커서를 공통 조상까지 unmake_move 로 되돌린 뒤 그 노드까지 make_move 로 내려가 맞춥니다.
+# 수를 이어서 두거나 옆 가지로 옮겨 가는 정도는 몇 수만 움직이면 됩니다.
+# 커서를 공유하므로 한 트리를 여러 스레드에서 동시에 쓰면 안 됩니다.
+
+from array import array
+
+from .position import Position
+from .rules import is_in_check
+from .movegen import generate_legal_moves
+from .fen import parse_fen, to_fen
+
+
+class _Cursor:
+    __slots__ = ("pos", "node")
+
+    def __init__(self, pos, node):
+        self.pos = pos
+        self.node = node
+
+
+class FrozenPosition:
+    """바꿀 수 없는 국면. Zobrist 키로 해시/비교하므로 dict/set 의 키로 쓸 수 있습니다."""
+
+    __slots__ = ("parent", "move", "key", "ply", "_cursor")
+
+    def __init__(self, position=None):
+        """position (기본: 시작 국면) 을 뿌리로 하는 새 트리. position 은 복사하므로 그 뒤에 바꿔도 됩니다."""
+        pos = position.copy() if position is not None else Position.start()
+        self.parent = None
+        self.move = None
+        self.key = pos.key
+        self.ply = 0
+        self._cursor = _Cursor(pos, self)
+
+    @classmethod
+    def from_position(cls, pos):
+        return cls(pos)
+
+    @classmethod
+    def from_fen(cls, fen):
+        return cls(parse_fen(fen))
+
+    def _child(self, move, key):
+        node = FrozenPosition.__new__(FrozenPosition)
+        node.parent = self
+        node.move = move
+        node.key = key
+        node.ply = self.ply + 1
+        node._cursor = self._cursor
+        return node
+
+    def _sync(self):
+        """공유 커서를 이 노드의 국면으로 옮기고 그 Position 을 돌려줍니다 (읽기만 해야 합니다)."""
+        cursor = self._cursor
+        node = cursor.node
+        if node is self: return cursor.pos
+        pos, target, path = cursor.pos, self, []
+        while target.ply > node.ply:
+            path.append(target.move); target = target.parent
+        while node.ply > target.ply:
+            pos.unmake_move(); node = node.parent
+        while node is not target:  # 같은 깊이에서 공통 조상을 만날 때까지 함께 올라갑니다
+            pos.unmake_move(); node = node.parent
+            path.append(target.move); target = target.parent
+        for move in reversed(path):
+            pos.make_move(move)
+        cursor.node = self
+        return pos
+
+    def play(self, move):
+        """move 를 둔 새 국면. 이 국면은 그대로입니다."""
+        pos = self._sync()
+        if move not in generate_legal_moves(pos):
+            raise ValueError(f"둘 수 없는 수입니다: {move}")
+        pos.make_move(move)
+        child = self._child(move, pos.key)
+        self._cursor.node = child
+        return child
+
+    def line(self):
+        """뿌리부터 이 국면까지 둔 수들."""
+        moves, node = [], self
+        while node.parent is not None:
+            moves.append(node.move); node = node.parent
+        return array("H", reversed(moves))
+
+    def to_position(self):
+        """수를 둘 수 있는 Position 복사본 (되돌리기 기록은 비어 있음)."""
+        return self._sync().copy()
+
+    @property
+    def turn(self):
+        return self._sync().turn
+
+    @property
+    def board(self):
+        return bytes(self._sync().board)
+
+    def piece_at(self, sq):
+        return self._sync().board[sq]
+
+    @property
+    def in_check(self):
+        pos = self._sync()
+        return is_in_check(pos, pos.turn)
+
+    @property
+    def legal_moves(self):
+        return generate_legal_moves(self._sync())
+
+    @property
+    def fen(self):
+        return to_fen(self._sync())
+
+    def __eq__(self, other):
+        return isinstance(other, FrozenPosition) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return f"FrozenPosition({self.fen!r})"
@@ -0,0 +1,159 @@
+# --- 한 판의 게임 상태 ---
+# 국면, 합법 수 목록, 반복 기록, 양쪽 시계, 게임 결과를 전역 변수 대신 Game 객체 하나에 담습니다.
+# pygame 화면은 이 객체를 읽고 play / tick / resign 등을 부르기만 하면 됩니다.
+# 체크 여부, 합법 수, 결과 같은 국면 판정은 수를 둘 때 한 번만 계산해 Game.status 에 넣어 두고,
+# 화면 그리기와 클릭 처리는 매 프레임 다시 계산하지 않고 이것을 읽습니다.
+
+from array import array
+from itertools import chain
+import sys
+
+from .position import WHITE, COLOR_NAMES, Position
+from .material import is_dead_draw
+from .rules import is_in_check
+from .movegen import iter_legal_moves, find_move
+from .zobrist import RepetitionTable
+
+TOTAL_GAME_TIME = 10 * 60
+
+
+class PositionStatus:
+    """한 국면의 판정 결과. 국면이 바뀌기 전까지(다음 수를 두기 전까지) 그대로 씁니다.
+
+    in_check: 차례인 쪽이 체크인지
+    legal_moves: 합법 수 목록 (처음 읽을 때 만듭니다)
+    draw_reasons: 해당하는 무승부 규칙 메시지들 (draw_rules=False 면 항상 빈 리스트)
+    result: 이 국면에서 게임이 끝나면 결과 메시지, 아니면 None
+    """
+
+    def __init__(self, in_check, legal_moves, draw_reasons, result):
+        self.in_check = in_check
+        self._legal_moves = legal_moves  # array('H'), 또는 아직 다 꺼내지 않은 iter_legal_moves
+        self.draw_reasons = draw_reasons
+        self.result = result
+
+    @property
+    def legal_moves(self):
+        if not isinstance(self._legal_moves, array): self._legal_moves = array("H", self._legal_moves)
+        return self._legal_moves
+
+
+class Game:
+    def __init__(self, position=None, total_time=TOTAL_GAME_TIME, draw_rules=True):
+        """draw_rules=False 이면 50수/3회 반복/기물 부족 무승부를 판정하지 않습니다."""
+        self.position = position if position is not None else Position.start()
+        self.total_time = total_time
+        self.draw_rules = draw_rules
+        self.times = [total_time, total_time]  # [백, 흑] 남은 시간(초)
+        self.moves = array("H")  # 지금까지 둔 수 (16비트씩)
+        self.repetitions = RepetitionTable()
+        self.repetitions.push(self.position.key)
+        self.status = None
+        self.game_over = False
+        self.winner_msg = ""
+        self.draw_offered = False
+        self.check_end_game()
+
+    @property
+    def turn(self):
+        return self.position.turn
+
+    @property
+    def current_turn(self):
+        """"white" / "black" """
+        return COLOR_NAMES[self.position.turn]
+
+    @property
+    def legal_moves(self):
+        return self.status.legal_moves
+
+    @property
+    def in_check(self):
+        return self.status.in_check
+
+    def find_move(self, from_sq, to_sq):
+        return find_move(self.status.legal_moves, from_sq, to_sq)
+
+    def play(self, move):
+        if self.game_over or move not in self.status.legal_moves:
+            raise ValueError(f"둘 수 없는 수입니다: {move}")
+        pos = self.position
+        pos.make_move(move)
+        self.moves.append(move)
+        self.repetitions.push(pos.key, pos.halfmove_clock == 0) # 캡처나 폰 이동 시 기록 초기화
+        self.check_end_game()
+
+    def record(self):
+        """지금까지 둔 수들을 바이트로 (수 하나에 2바이트, 리틀 엔디언). 시작 국면은 담지 않습니다."""
+        moves = array("H", self.moves)
+        if sys.byteorder == "big": moves.byteswap()
+        return moves.tobytes()
+
+    @classmethod
+    def replay(cls, record, position=None, **kwargs):
+        """record() 로 저장한 수들을 position (기본: 시작 국면) 부터 다시 둔 Game."""
+        moves = array("H")
+        moves.frombytes(record)
+        if sys.byteorder == "big": moves.byteswap()
+        game = cls(position, **kwargs)
+        for move in moves:
+            game.play(move)
+        return game
+
+    def is_insufficient_material(self):
+        """기물 구성만으로 메이트가 나올 수 없는지 (K 대 K, K+N 대 K, 같은 색 칸 비숍만 남은 경우)."""
+        return is_dead_draw(self.position.material)
+
+    def evaluate(self):
+        """현재 국면의 PositionStatus 를 계산합니다. 무승부 규칙은 모두 확인해 draw_reasons 에 모읍니다."""
+        pos = self.position
+        # 끝났는지는 합법 수가 하나라도 있는지만 보면 되므로 첫 수만 꺼내 둡니다.
+        # 나머지는 legal_moves 를 처음 읽을 때 (play 로 국면이 바뀌기 전에) 마저 만듭니다.
+        moves = iter_legal_moves(pos)
+        first = next(moves, None)
+        legal_moves = array("H") if first is None else chain((first,), moves)
+        in_check = is_in_check(pos, pos.turn)
+        draw_reasons = []
+        if self.draw_rules:
+            if self.is_insufficient_material(): draw_reasons.append("DRAW (INSUFFICIENT MATERIAL)")
+            if pos.halfmove_clock >= 100: draw_reasons.append("DRAW (50-MOVE RULE)")
+            if self.repetitions.count(pos.key) >= 3: draw_reasons.append("DRAW (THREEFOLD REPETITION)")
+        # 메이트가 된 수는 그 수로 50수 규칙 등에 닿더라도 게임을 끝냅니다.
+        if first is None and in_check:
+            result = f"CHECKMATE! {'BLACK' if pos.turn == WHITE else 'WHITE'} WINS!"
+        elif draw_reasons:
+            result = draw_reasons[0]
+        elif first is None:
+            result = "STALEMATE! IT'S A DRAW."
+        else:
+            result = None
+        return PositionStatus(in_check, legal_moves, draw_reasons, result)
+
+    def check_end_game(self):
+        """국면이 바뀔 때마다 (게임 시작, play) 한 번 부릅니다."""
+        self.status = self.evaluate()
+        if self.status.result: self.finish(self.status.result)
+
+    def finish(self, message):
+        self.game_over, self.winner_msg = True, message
+
+    def tick(self, dt):
+        """차례인 쪽의 시계를 dt 초만큼 줄입니다. 시간이 다 되면 게임이 끝납니다."""
+        if self.game_over: return
+        turn = self.position.turn
+        self.times[turn] -= dt
+        if self.times[turn] <= 0:
+            self.times[turn] = 0
+            self.finish(f"TIME OVER! {'BLACK' if turn == WHITE else 'WHITE'} WINS!")
+
+    def resign(self, color=None):
+        """color (기본: 차례인 쪽) 가 기권합니다."""
+        if color is None: color = self.position.turn
+        self.finish(f"{COLOR_NAMES[color].upper()} RESIGNED.")
+
+    def offer_draw(self):
+        self.draw_offered = True
+
+    def answer_draw(self, accept):
+        if accept: self.finish("DRAW BY AGREEMENT.")
+        self.draw_offered = False
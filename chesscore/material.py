@@ -0,0 +1,56 @@
+# --- 기물 구성(material) 키와 기물 부족 무승부 ---
+# Position.material 은 킹을 뺀 기물 코드별 개수와 칸 색깔별 비숍 개수를 정수 하나에 담은 키입니다.
+# (자세한 비트 배치는 position.py 의 MATERIAL_KEYS 참고) 수를 둘 때마다 Position 이 더하고 빼며 갱신하므로,
+# 기물 부족 무승부는 미리 만들어 둔 키 집합에서 한 번 찾아보면 됩니다.
+# 평가 함수나 엔드게임 테이블에서도 같은 키로 기물 구성을 구분할 수 있습니다.
+
+from .position import WHITE, BLACK, KNIGHT, BISHOP, MATERIAL_BISHOP_SHIFT, make_piece
+
+MAX_COUNT = 10  # 한 종류의 기물이 가질 수 있는 최대 개수 (원래 2개 + 승진 8개)
+
+
+def material_count(material, pc):
+    """기물 코드 pc 의 개수."""
+    return (material >> (4 * pc)) & 15
+
+def bishop_counts(material, color):
+    """color 진영 비숍의 (밝은 칸 개수, 어두운 칸 개수)."""
+    shift = MATERIAL_BISHOP_SHIFT + 8 * color
+    return (material >> shift) & 15, (material >> (shift + 4)) & 15
+
+def make_material_key(counts=(), bishops=((0, 0), (0, 0))):
+    """counts = {기물 코드: 개수} (비숍 제외), bishops = ((백 밝은 칸, 백 어두운 칸), (흑 밝은 칸, 흑 어두운 칸))."""
+    material = 0
+    for pc, n in dict(counts).items():
+        material += n << (4 * pc)
+    for color in (WHITE, BLACK):
+        light, dark = bishops[color]
+        material += (light + dark) << (4 * make_piece(color, BISHOP))
+        material += light << (MATERIAL_BISHOP_SHIFT + 8 * color)
+        material += dark << (MATERIAL_BISHOP_SHIFT + 8 * color + 4)
+    return material
+
+
+def _dead_draw_keys():
+    """어떤 수를 두어도 메이트가 나올 수 없는 기물 구성 (FIDE 규칙 9.6.2).
+
+    - 킹만 남은 경우
+    - 킹 + 나이트 하나 대 킹
+    - 비숍만 남고 모든 비숍이 같은 색 칸에 있는 경우 (킹 + 비숍 대 킹, 같은 색 비숍끼리 등)
+    """
+    keys = {make_material_key()}
+    for color in (WHITE, BLACK):
+        keys.add(make_material_key({make_piece(color, KNIGHT): 1}))
+    for white in range(MAX_COUNT + 1):
+        for black in range(MAX_COUNT + 1):
+            if white + black == 0: continue
+            keys.add(make_material_key(bishops=((white, 0), (black, 0))))
+            keys.add(make_material_key(bishops=((0, white), (0, black))))
+    return frozenset(keys)
+
+DEAD_DRAW_KEYS = _dead_draw_keys()
+
+
+def is_dead_draw(material):
+    """기물 구성만으로 무승부가 확정인지."""
+    return material in DEAD_DRAW_KEYS
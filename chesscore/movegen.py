@@ -0,0 +1,318 @@
+# --- 수 생성기 ---
+# 64칸을 모두 is_legal_move 로 시험하는 대신, 기물 종류별로 갈 수 있는 칸만 만들어 검사합니다.
+# 수는 16비트 정수 하나: from | to << 6 | 플래그 << 12 (승진 기물 종류, 두 칸 전진, 캐슬링, 앙파상)
+# 수 목록은 array('H') 이므로 수 하나가 2바이트입니다.
+#
+# 국면마다 한 번, 킹 칸에서 광선을 쏴서 체크 중인 기물(checkers)과 핀에 걸린 기물(pinned)을 구해 둡니다.
+# 그러면 수를 직접 두어 보지 않고도 합법 수만 만들 수 있습니다.
+#   - 핀에 걸린 기물은 핀 광선 위로만 움직입니다.
+#   - 체크 중이면 체크한 칸과 사이 칸에서 거꾸로 그 칸에 올 수 있는 내 기물만 찾습니다. (더블 체크면 킹만)
+#   - 킹은 상대가 공격하는 칸으로 가지 않습니다.
+# 앙파상만은 같은 줄의 두 폰이 한꺼번에 사라지는 경우가 있어 실제로 두어 보고 확인합니다.
+
+from array import array
+
+from .position import (
+    PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, SYMBOLS, MOVE_DOUBLE_PUSH, MOVE_CASTLE, MOVE_EN_PASSANT,
+    make_piece, square_name,
+)
+from .attacks import (
+    KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, ROOK_RAYS, BISHOP_RAYS, BETWEEN,
+    rook_attacks, bishop_attacks, queen_attacks, PAWN_PUSHES, PAWN_DOUBLE_PUSHES, PAWN_PROMOTION_ROW,
+    PAWN_START_ROW, PAWN_STEP,
+)
+from .rules import PROMOTION_PIECES, CASTLING, attackers_to, is_square_attacked, is_in_check
+
+
+_DOUBLE_PUSH = MOVE_DOUBLE_PUSH << 12
+_CASTLE = MOVE_CASTLE << 12
+_EN_PASSANT = MOVE_EN_PASSANT << 12
+
+
+def encode_move(from_sq, to_sq, flag=0):
+    """flag 는 승진 기물 종류 또는 MOVE_DOUBLE_PUSH / MOVE_CASTLE / MOVE_EN_PASSANT."""
+    return from_sq | (to_sq << 6) | (flag << 12)
+
+def move_from(move):
+    return move & 63
+
+def move_to(move):
+    return (move >> 6) & 63
+
+def move_flag(move):
+    return move >> 12
+
+def move_promotion(move):
+    flag = move >> 12
+    return flag if KNIGHT <= flag <= QUEEN else 0
+
+def move_name(move):
+    """"e2e4", "e7e8q" 같은 좌표 표기."""
+    promotion = move_promotion(move)
+    return square_name(move & 63) + square_name((move >> 6) & 63) + (SYMBOLS[promotion].lower() if promotion else "")
+
+
+def between(a, b):
+    """같은 줄(가로/세로/대각선)에 있는 두 칸 사이의 칸들. 같은 줄이 아니면 0."""
+    return BETWEEN[a][b]
+
+
+def checkers_and_pins(pos, color):
+    """(체크 중인 상대 기물들, {핀에 걸린 내 기물 칸: 움직일 수 있는 칸들}) 을 돌려줍니다."""
+    k_sq = pos.king_square[color]
+    own = pos.occupied[color]
+    occ = own | pos.occupied[color ^ 1]
+    checkers = attackers_to(pos, k_sq, color ^ 1, occ)
+    pins = {}
+    bbs = pos.bitboards
+    base = (color ^ 1) << 3
+    queens = bbs[base | QUEEN]
+    # 빈 보드에서 킹과 같은 줄에 있는 상대 슬라이딩 기물들
+    snipers = ((ROOK_RAYS[k_sq] & (bbs[base | ROOK] | queens))
+               | (BISHOP_RAYS[k_sq] & (bbs[base | BISHOP] | queens)))
+    between_king = BETWEEN[k_sq]
+    while snipers:
+        low = snipers & -snipers
+        snipers ^= low
+        s_sq = low.bit_length() - 1
+        line = between_king[s_sq]
+        blockers = line & occ
+        # 사이에 기물이 정확히 하나 있고 그게 내 기물이면 핀
+        if blockers and not blockers & (blockers - 1) and blockers & own:
+            pins[blockers.bit_length() - 1] = line | low
+    return checkers, pins
+
+
+def _king_steps(pos, color, k_sq, targets, occ):
+    """킹 한 칸 이동 (targets 안의 칸으로만). 킹을 뺀 점유 상태로 공격 여부를 봐야 광선 뒤쪽으로 물러나는 수를 막을 수 있습니다."""
+    enemy_color = color ^ 1
+    no_king = occ ^ (1 << k_sq)
+    targets &= KING_ATTACKS[k_sq]
+    while targets:
+        low = targets & -targets
+        targets ^= low
+        to_sq = low.bit_length() - 1
+        if not is_square_attacked(pos, to_sq, enemy_color, no_king): yield k_sq | (to_sq << 6)
+
+
+def iter_evasions(pos, checkers=None, pins=None):
+    """체크를 당한 쪽의 합법 수만 만드는 제너레이터. (킹 이동 -> 체크한 기물 잡기 -> 사이 막기)
+
+    모든 기물의 이동을 만들지 않고, 체크한 칸과 사이 칸에서 거꾸로 내 기물을 찾습니다.
+    핀에 걸린 기물은 체크를 풀 수 없으므로 보지 않습니다.
+    """
+    color = pos.turn
+    own = pos.occupied[color]
+    occ = own | pos.occupied[color ^ 1]
+    k_sq = pos.king_square[color]
+    if checkers is None: checkers, pins = checkers_and_pins(pos, color)
+    yield from _king_steps(pos, color, k_sq, ~own, occ)
+    if checkers & (checkers - 1):  # 더블 체크: 킹만 움직일 수 있습니다.
+        return
+
+    bbs = pos.bitboards
+    base = color << 3
+    pawns = bbs[base | PAWN]
+    movable = own & ~bbs[base | KING]
+    for sq in pins: movable &= ~(1 << sq)
+    promo_row = PAWN_PROMOTION_ROW[color]
+    c_sq = checkers.bit_length() - 1
+
+    # 체크한 기물 잡기
+    b = attackers_to(pos, c_sq, color, occ) & movable
+    while b:
+        low = b & -b
+        b ^= low
+        from_sq = low.bit_length() - 1
+        if low & pawns and c_sq >> 3 == promo_row:
+            for promo in PROMOTION_PIECES:
+                yield from_sq | (c_sq << 6) | (promo << 12)
+        else:
+            yield from_sq | (c_sq << 6)
+    ep = pos.ep_square
+    if ep is not None:
+        # 앙파상은 두어 보고 킹이 체크되는지 직접 확인합니다.
+        b = PAWN_ATTACKS[color ^ 1][ep] & pawns
+        while b:
+            low = b & -b
+            b ^= low
+            move = (low.bit_length() - 1) | (ep << 6) | _EN_PASSANT
+            pos.make_move(move)
+            legal = not is_in_check(pos, color)
+            pos.unmake_move()
+            if legal: yield move
+
+    # 사이 막기: 사이 칸은 비어 있으므로 폰은 전진으로만 막을 수 있습니다.
+    block = BETWEEN[k_sq][c_sq]
+    step = PAWN_STEP[color]
+    start_row = PAWN_START_ROW[color]
+    pawn_movable = pawns & movable
+    while block:
+        low = block & -block
+        block ^= low
+        sq = low.bit_length() - 1
+        b = attackers_to(pos, sq, color, occ) & movable & ~pawns
+        while b:
+            b_low = b & -b
+            b ^= b_low
+            yield (b_low.bit_length() - 1) | (sq << 6)
+        from_sq = sq - step
+        if not 0 <= from_sq < 64: continue
+        if pawn_movable >> from_sq & 1:
+            if sq >> 3 == promo_row:
+                for promo in PROMOTION_PIECES:
+                    yield from_sq | (sq << 6) | (promo << 12)
+            else:
+                yield from_sq | (sq << 6)
+        elif not occ >> from_sq & 1 and (from_sq - step) >> 3 == start_row and pawn_movable >> (from_sq - step) & 1:
+            yield (from_sq - step) | (sq << 6) | _DOUBLE_PUSH
+
+
+def iter_legal_moves(pos, captures_only=False):
+    """차례인 쪽의 합법 수를 하나씩 내놓는 제너레이터.
+
+    확인이 싼 순서로 내놓습니다: 킹 한 칸 이동 -> 잡는 수(앙파상 포함) -> 조용한 수(캐슬링, 폰 전진 포함).
+    체크 중이면 iter_evasions 에 맡깁니다.
+    captures_only=True 이면 잡는 수만 내놓습니다 (체크 중이면 체크를 피하는 수 전부).
+    합법 수가 있는지만 알거나 앞의 몇 개만 필요하면 중간에 멈추면 됩니다.
+    다음 수를 꺼낼 때 pos 는 처음과 같은 국면이어야 합니다 (사이에 두었던 수는 되돌려 놓기).
+    """
+    color = pos.turn
+    enemy_color = color ^ 1
+    bbs = pos.bitboards
+    own = pos.occupied[color]
+    enemy = pos.occupied[enemy_color]
+    occ = own | enemy
+    k_sq = pos.king_square[color]
+    checkers, pins = checkers_and_pins(pos, color)
+    if checkers:
+        yield from iter_evasions(pos, checkers, pins)
+        return
+    yield from _king_steps(pos, color, k_sq, enemy if captures_only else ~own, occ)
+
+    # 킹 말고 기물별 (출발 칸, 갈 수 있는 칸들). 잡는 수와 조용한 수에서 같이 씁니다.
+    base = color << 3
+    piece_targets = []
+    for ptype, attack in ((KNIGHT, None), (BISHOP, bishop_attacks), (ROOK, rook_attacks), (QUEEN, queen_attacks)):
+        b = bbs[base | ptype]
+        while b:
+            low = b & -b
+            b ^= low
+            from_sq = low.bit_length() - 1
+            targets = (KNIGHT_ATTACKS[from_sq] if attack is None else attack(from_sq, occ)) & ~own
+            if from_sq in pins: targets &= pins[from_sq]
+            if targets: piece_targets.append((from_sq, targets))
+    pawns = bbs[base | PAWN]
+    pawn_attacks = PAWN_ATTACKS[color]
+    promo_row = PAWN_PROMOTION_ROW[color]
+
+    # 잡는 수
+    for from_sq, targets in piece_targets:
+        targets &= enemy
+        while targets:
+            t_low = targets & -targets
+            targets ^= t_low
+            yield from_sq | ((t_low.bit_length() - 1) << 6)
+    ep = pos.ep_square
+    b = pawns
+    while b:
+        low = b & -b
+        b ^= low
+        from_sq = low.bit_length() - 1
+        targets = pawn_attacks[from_sq] & enemy
+        if from_sq in pins: targets &= pins[from_sq]
+        while targets:
+            t_low = targets & -targets
+            targets ^= t_low
+            to_sq = t_low.bit_length() - 1
+            if to_sq >> 3 == promo_row:
+                for promo in PROMOTION_PIECES:
+                    yield from_sq | (to_sq << 6) | (promo << 12)
+            else:
+                yield from_sq | (to_sq << 6)
+        if ep is not None and pawn_attacks[from_sq] >> ep & 1:
+            # 앙파상은 두어 보고 킹이 체크되는지 직접 확인합니다.
+            move = from_sq | (ep << 6) | _EN_PASSANT
+            pos.make_move(move)
+            legal = not is_in_check(pos, color)
+            pos.unmake_move()
+            if legal: yield move
+    if captures_only: return
+
+    # 조용한 수
+    board = pos.board
+    for to_sq, (rights, king_from, _, rook_sq, _, empty_sqs, path) in CASTLING[color].items():
+        if (pos.castling & rights and k_sq == king_from and not occ & empty_sqs
+                and board[rook_sq] == make_piece(color, ROOK)):
+            # 지금 체크가 아니니 킹이 지나가는 칸과 도착 칸만 보면 됩니다.
+            path ^= 1 << k_sq
+            while path:
+                low = path & -path
+                path ^= low
+                if is_square_attacked(pos, low.bit_length() - 1, enemy_color): break
+            else:
+                yield k_sq | (to_sq << 6) | _CASTLE
+    empty = ~occ
+    for from_sq, targets in piece_targets:
+        targets &= empty
+        while targets:
+            t_low = targets & -targets
+            targets ^= t_low
+            yield from_sq | ((t_low.bit_length() - 1) << 6)
+    pushes = PAWN_PUSHES[color]
+    double_pushes = PAWN_DOUBLE_PUSHES[color]
+    b = pawns
+    while b:
+        low = b & -b
+        b ^= low
+        from_sq = low.bit_length() - 1
+        push = pushes[from_sq] & empty
+        if not push: continue
+        double = double_pushes[from_sq] & empty
+        if from_sq in pins:
+            push &= pins[from_sq]
+            double &= pins[from_sq]
+            if not push: continue
+        to_sq = push.bit_length() - 1
+        if to_sq >> 3 == promo_row:
+            for promo in PROMOTION_PIECES:
+                yield from_sq | (to_sq << 6) | (promo << 12)
+        else:
+            yield from_sq | (to_sq << 6)
+        if double: yield from_sq | ((double.bit_length() - 1) << 6) | _DOUBLE_PUSH
+
+
+def generate_legal_moves(pos):
+    """차례인 쪽의 모든 합법 수 array('H') (iter_legal_moves 와 같은 순서)."""
+    return array("H", iter_legal_moves(pos))
+
+
+def generate_captures(pos):
+    """잡는 수만 array('H') 로 (정지 탐색용). 체크 중이면 체크를 피하는 수 전부입니다."""
+    return array("H", iter_legal_moves(pos, True))
+
+
+def has_legal_move(pos):
+    """합법 수가 하나라도 있는지. 첫 수를 찾으면 바로 멈춥니다."""
+    return next(iter_legal_moves(pos), None) is not None
+
+
+def find_move(moves, from_sq, to_sq):
+    """from_sq -> to_sq 인 수를 찾습니다. 승진이면 기물 종류만 다른 수 중 첫 번째(퀸)를 돌려줍니다."""
+    key = from_sq | (to_sq << 6)
+    for move in moves:
+        if move & 4095 == key: return move
+    return None
+
+
+def is_legal_move(pos, from_sq, to_sq):
+    """pos 의 차례인 쪽이 from_sq -> to_sq 를 둘 수 있는지 (승진은 기물 종류와 상관없이)."""
+    return find_move(generate_legal_moves(pos), from_sq, to_sq) is not None
+
+
+def legal_target_mask(moves, from_sq):
+    """from_sq 에서 출발하는 수들의 도착 칸 비트보드. 기물을 고를 때 한 번 구해 두고 힌트와 클릭 확인에 같이 씁니다."""
+    mask = 0
+    for move in moves:
+        if move & 63 == from_sq: mask |= 1 << ((move >> 6) & 63)
+    return mask
@@ -0,0 +1,101 @@
+# --- 32바이트 고정 크기 국면 인코딩 ---
+# 프로세스 사이로 국면을 보내거나 대량으로 저장할 때 씁니다. 결과는 bytes 라 그대로 dict/set 키로 쓸 수 있습니다.
+#
+#   0..7    점유 비트보드 (리틀 엔디언, 비트 번호 = 칸 번호)
+#   8..23   기물 코드 4비트씩, 점유 칸을 작은 번호부터 (앞 칸이 낮은 니블). 기물은 최대 32개
+#   24..29  차례/캐슬링/앙파상/수 카운트 (position.pack_state, CompactPosition 의 64..69 와 같은 배치)
+#   30..31  0
+#
+# pack_batch / unpack_batch 는 NumPy 로 여러 국면을 한꺼번에 (n, 32) uint8 배열과 주고받습니다.
+# NumPy 는 이 두 함수를 부를 때만 불러옵니다.
+
+from .position import STATE_SIZE, Position, pack_state, unpack_state
+
+PACKED_SIZE = 32
+MAX_PIECES = 32
+_STATE_START = 24
+_STATE_END = _STATE_START + STATE_SIZE
+_PADDING = b"\0" * (PACKED_SIZE - _STATE_END)
+
+
+def _state_bytes(pos):
+    return pack_state(pos.turn, pos.castling, pos.ep_square, pos.halfmove_clock, pos.fullmove_number) + _PADDING
+
+
+def pack_position(pos):
+    """Position -> 32바이트 bytes."""
+    occ = pos.occupied[0] | pos.occupied[1]
+    board = pos.board
+    codes = []
+    b = occ
+    while b:
+        low = b & -b
+        b ^= low
+        codes.append(board[low.bit_length() - 1])
+    if len(codes) > MAX_PIECES:
+        raise ValueError(f"기물이 {MAX_PIECES}개보다 많은 국면은 인코딩할 수 없습니다: {len(codes)}")
+    codes += [0] * (MAX_PIECES - len(codes))
+    nibbles = bytes(codes[i] | (codes[i + 1] << 4) for i in range(0, MAX_PIECES, 2))
+    return occ.to_bytes(8, "little") + nibbles + _state_bytes(pos)
+
+
+def unpack_position(data):
+    """32바이트 -> Position (되돌리기 기록은 비어 있음)."""
+    if len(data) != PACKED_SIZE:
+        raise ValueError(f"인코딩된 국면은 {PACKED_SIZE}바이트여야 합니다: {len(data)}")
+    occ = int.from_bytes(data[:8], "little")
+    board = bytearray(64)
+    i = 0
+    while occ:
+        low = occ & -occ
+        occ ^= low
+        byte = data[8 + (i >> 1)]
+        board[low.bit_length() - 1] = (byte >> 4) if i & 1 else (byte & 15)
+        i += 1
+    return Position.from_board(board, *unpack_state(data[_STATE_START:_STATE_END]))
+
+
+def pack_batch(positions):
+    """여러 Position -> (n, 32) uint8 배열. 기물 코드 정렬과 니블/비트 묶기를 배열 연산으로 한꺼번에 합니다."""
+    import numpy as np
+
+    n = len(positions)
+    out = np.zeros((n, PACKED_SIZE), dtype=np.uint8)
+    if not n: return out
+    boards = np.frombuffer(b"".join(bytes(pos.board) for pos in positions), dtype=np.uint8).reshape(n, 64)
+    occupied = boards != 0
+    if (occupied.sum(axis=1) > MAX_PIECES).any():
+        raise ValueError(f"기물이 {MAX_PIECES}개보다 많은 국면은 인코딩할 수 없습니다")
+    # 점유 칸을 앞으로 (칸 번호 순서 유지), 그 뒤는 빈 칸이라 코드가 0
+    order = np.argsort(~occupied, axis=1, kind="stable")[:, :MAX_PIECES]
+    codes = np.take_along_axis(boards, order, axis=1)
+    out[:, 0:8] = np.packbits(occupied, axis=1, bitorder="little")
+    out[:, 8:24] = codes[:, 0::2] | (codes[:, 1::2] << 4)
+    out[:, _STATE_START:] = np.frombuffer(b"".join(_state_bytes(pos) for pos in positions),
+                                          dtype=np.uint8).reshape(n, PACKED_SIZE - _STATE_START)
+    return out
+
+
+def unpack_boards(packed):
+    """(n, 32) uint8 배열 -> (n, 64) uint8 기물 코드 배열. Position 을 만들지 않고 보드만 필요할 때 씁니다."""
+    import numpy as np
+
+    packed = np.asarray(packed, dtype=np.uint8).reshape(-1, PACKED_SIZE)
+    occupied = np.unpackbits(packed[:, 0:8], axis=1, bitorder="little").astype(bool)
+    codes = np.empty((len(packed), MAX_PIECES), dtype=np.uint8)
+    codes[:, 0::2] = packed[:, 8:24] & 15
+    codes[:, 1::2] = packed[:, 8:24] >> 4
+    # 각 점유 칸이 몇 번째 기물인지 = 그 칸까지의 점유 칸 개수 - 1
+    index = np.clip(np.cumsum(occupied, axis=1) - 1, 0, MAX_PIECES - 1)
+    return np.where(occupied, np.take_along_axis(codes, index, axis=1), 0).astype(np.uint8)
+
+
+def unpack_batch(packed):
+    """(n, 32) uint8 배열 -> Position 리스트."""
+    import numpy as np
+
+    packed = np.asarray(packed, dtype=np.uint8).reshape(-1, PACKED_SIZE)
+    boards = unpack_boards(packed)
+    states = packed[:, _STATE_START:_STATE_END].tobytes()
+    return [Position.from_board(bytes(board), *unpack_state(states[i * STATE_SIZE:(i + 1) * STATE_SIZE]))
+            for i, board in enumerate(boards)]
@@ -0,0 +1,122 @@
+# --- Perft: 규칙 검증 + 속도 측정 ---
+# 정해진 깊이까지 모든 합법 수를 두어 보며 끝 국면 수를 셉니다.
+# 알려진 값과 다르면 수 생성 규칙 어딘가가 틀린 것이고, 초당 노드 수로 속도를 비교할 수 있습니다.
+#
+#   python -m chesscore.perft                  # 기준 국면 전체 (기본 최대 노드 수까지)
+#   python -m chesscore.perft --depth 4        # 모든 기준 국면을 깊이 4까지
+#   python -m chesscore.perft --divide 3 kiwipete
+#   python -m chesscore.perft --divide 2 "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1"
+
+import argparse
+import sys
+import time
+
+from .fen import START_FEN, parse_fen
+from .movegen import generate_legal_moves, move_name
+
+# (이름, FEN, 깊이 1부터의 알려진 노드 수) - https://www.chessprogramming.org/Perft_Results
+REFERENCE_POSITIONS = [
+    ("start", START_FEN,
+     [20, 400, 8902, 197281, 4865609, 119060324]),
+    ("kiwipete", "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+     [48, 2039, 97862, 4085603, 193690690]),
+    ("en-passant", "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+     [14, 191, 2812, 43238, 674624, 11030083]),
+    ("castling", "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+     [6, 264, 9467, 422333, 15833292]),
+    ("castling-mirrored", "r2q1rk1/pP1p2pp/Q4n2/bbp1p3/Np6/1B3NBn/pPPP1PPP/R3K2R b KQ - 0 1",
+     [6, 264, 9467, 422333, 15833292]),
+    ("promotion", "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+     [44, 1486, 62379, 2103487, 89941194]),
+    ("middlegame", "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+     [46, 2079, 89890, 3894594, 164075551]),
+]
+
+# parse_fen 이 ValueError 로 거절해야 하는 FEN (이름, FEN). 받아들이면 수 생성/되돌리기가 보드를 망가뜨립니다.
+REJECTED_FENS = [
+    ("ep-without-pawn", "4k3/8/8/3P4/8/8/8/4K3 w - e6 0 1"),
+    ("ep-behind-knight", "4k3/8/8/3Pn3/8/8/8/4K3 w - e6 0 1"),
+    ("negative-halfmove", "4k3/8/8/8/8/8/8/4K3 w - - -3 1"),
+    ("zero-fullmove", "4k3/8/8/8/8/8/8/4K3 w - - 0 0"),
+]
+
+
+def perft(pos, depth):
+    """depth 수 뒤의 끝 국면 개수. 마지막 한 수는 두지 않고 수 목록 길이로 셉니다."""
+    if depth <= 0: return 1
+    moves = generate_legal_moves(pos)
+    if depth == 1: return len(moves)
+    nodes = 0
+    for move in moves:
+        pos.make_move(move)
+        nodes += perft(pos, depth - 1)
+        pos.unmake_move()
+    return nodes
+
+
+def divide(pos, depth):
+    """첫 수마다 나눈 노드 수 [(수, 노드 수), ...]. 다른 엔진과 비교해 틀린 가지를 찾을 때 씁니다. depth 는 1 이상."""
+    if depth < 1: raise ValueError(f"divide 깊이는 1 이상이어야 합니다: {depth}")
+    result = []
+    for move in generate_legal_moves(pos):
+        pos.make_move(move)
+        result.append((move, perft(pos, depth - 1)))
+        pos.unmake_move()
+    return result
+
+
+def run_suite(max_depth=None, max_nodes=1_000_000, out=sys.stdout):
+    """기준 국면들을 돌리고 (잘못된 FEN 은 거절되는지도 보고) 전부 맞았는지 돌려줍니다."""
+    all_ok = True
+    for name, fen in REJECTED_FENS:
+        try: parse_fen(fen)
+        except ValueError: ok = True
+        else: ok = False
+        all_ok = all_ok and ok
+        print(f"{'ok  ' if ok else 'FAIL'} {name:<18} rejected", file=out)
+    total_nodes, total_time = 0, 0.0
+    for name, fen, expected in REFERENCE_POSITIONS:
+        pos = parse_fen(fen)
+        for depth, want in enumerate(expected, 1):
+            if max_depth is not None and depth > max_depth: break
+            if max_depth is None and want > max_nodes: break
+            start = time.perf_counter()
+            got = perft(pos, depth)
+            elapsed = time.perf_counter() - start
+            ok = got == want
+            all_ok = all_ok and ok
+            total_nodes += got; total_time += elapsed
+            nps = got / elapsed if elapsed > 0 else 0
+            print(f"{'ok  ' if ok else 'FAIL'} {name:<18} depth {depth}  {got:>10} / {want:<10} "
+                  f"{elapsed:8.3f}s {nps:>10.0f} nps", file=out)
+    if total_time > 0:
+        print(f"total {total_nodes} nodes in {total_time:.3f}s = {total_nodes / total_time:.0f} nps", file=out)
+    return all_ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m chesscore.perft", description="perft 검증 및 속도 측정")
+    parser.add_argument("--depth", type=int, help="모든 기준 국면을 이 깊이까지 (기본: --max-nodes 이하인 깊이까지)")
+    parser.add_argument("--max-nodes", type=int, default=1_000_000, help="--depth 가 없을 때 돌릴 최대 노드 수")
+    parser.add_argument("--divide", nargs=2, metavar=("DEPTH", "POSITION"),
+                        help="기준 국면 이름이나 FEN 하나를 첫 수별로 나눠서 셉니다")
+    args = parser.parse_args(argv)
+
+    if args.divide:
+        depth, target = int(args.divide[0]), args.divide[1]
+        if depth < 1: parser.error("--divide 깊이는 1 이상이어야 합니다")
+        fen = next((f for name, f, _ in REFERENCE_POSITIONS if name == target), target)
+        pos = parse_fen(fen)
+        start = time.perf_counter()
+        total = 0
+        for move, nodes in sorted(divide(pos, depth), key=lambda item: move_name(item[0])):
+            print(f"{move_name(move)}: {nodes}")
+            total += nodes
+        elapsed = time.perf_counter() - start
+        print(f"\nmoves {len(generate_legal_moves(pos))}  nodes {total}  {elapsed:.3f}s")
+        return 0
+    return 0 if run_suite(args.depth, args.max_nodes) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
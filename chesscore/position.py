@@ -0,0 +1,336 @@
+# --- 보드 표현 (mailbox) ---
+# 칸 번호: sq = row * 8 + col  (row 0 = 흑 진영 8랭크, 즉 a8 = 0, h1 = 63)
+# 화면의 (col, row) 와 같은 방향이라 그리기용 픽셀 좌표는 col * TILE, row * TILE 로 바로 구할 수 있습니다.
+# 기물 코드: (색 << 3) | 종류  ->  백 P=1 ... K=6, 흑 P=9 ... K=14, 빈 칸 = 0
+
+from array import array
+
+from .zobrist import PIECE_KEYS, CASTLING_KEYS, EP_KEYS, SIDE_KEY, compute_key
+
+WHITE, BLACK = 0, 1
+COLOR_NAMES = ("white", "black")
+
+EMPTY = 0
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = 1, 2, 3, 4, 5, 6
+SYMBOLS = " PNBRQK"
+
+# 캐슬링 권한 비트
+WHITE_KINGSIDE, WHITE_QUEENSIDE, BLACK_KINGSIDE, BLACK_QUEENSIDE = 1, 2, 4, 8
+ALL_CASTLING = 15
+
+BACK_RANK = (ROOK, KNIGHT, BISHOP, QUEEN, KING, BISHOP, KNIGHT, ROOK)
+
+
+def make_piece(color, ptype):
+    return (color << 3) | ptype
+
+def piece_type(pc):
+    return pc & 7
+
+def piece_color(pc):
+    return pc >> 3
+
+def square(col, row):
+    return row * 8 + col
+
+def square_col(sq):
+    return sq & 7
+
+def square_row(sq):
+    return sq >> 3
+
+def color_of(team):
+    return WHITE if team == "white" else BLACK
+
+def square_name(sq):
+    """칸 번호 -> "e4" 같은 이름."""
+    return "abcdefgh"[sq & 7] + str(8 - (sq >> 3))
+
+def parse_square(name):
+    return (8 - int(name[1])) * 8 + "abcdefgh".index(name[0])
+
+
+# 어떤 칸에서 출발하거나 도착하면 사라지는 캐슬링 권한 (킹/룩의 원래 자리)
+CASTLING_MASK = [ALL_CASTLING] * 64
+CASTLING_MASK[square(4, 7)] &= ~(WHITE_KINGSIDE | WHITE_QUEENSIDE)
+CASTLING_MASK[square(7, 7)] &= ~WHITE_KINGSIDE
+CASTLING_MASK[square(0, 7)] &= ~WHITE_QUEENSIDE
+CASTLING_MASK[square(4, 0)] &= ~(BLACK_KINGSIDE | BLACK_QUEENSIDE)
+CASTLING_MASK[square(7, 0)] &= ~BLACK_KINGSIDE
+CASTLING_MASK[square(0, 0)] &= ~BLACK_QUEENSIDE
+
+# 캐슬링할 때 킹 도착 칸 -> (룩 출발 칸, 룩 도착 칸)
+CASTLING_ROOK = {
+    square(6, 7): (square(7, 7), square(5, 7)), square(2, 7): (square(0, 7), square(3, 7)),
+    square(6, 0): (square(7, 0), square(5, 0)), square(2, 0): (square(0, 0), square(3, 0)),
+}
+
+
+# 수: 16비트 정수 하나 = from | to << 6 | 플래그 << 12
+# 플래그 4비트: 0 보통 수, 2~5 승진 기물 종류 (N/B/R/Q), 아래 세 가지는 특수한 수
+MOVE_DOUBLE_PUSH = 1  # 폰 두 칸 전진 (앙파상 칸이 생김)
+MOVE_CASTLE = 6       # 캐슬링 (킹의 수로 표시)
+MOVE_EN_PASSANT = 7   # 앙파상
+
+
+def move_flags(pos, from_sq, to_sq):
+    """칸 두 개만 주어진 수에 붙일 플래그 (승진 제외). 수 생성기를 거치지 않은 수를 둘 때 씁니다."""
+    pc = pos.board[from_sq]
+    ptype = pc & 7
+    if ptype == PAWN:
+        if to_sq == pos.ep_square: return MOVE_EN_PASSANT
+        if abs(to_sq - from_sq) == 16: return MOVE_DOUBLE_PUSH
+    elif ptype == KING and abs(to_sq - from_sq) == 2:
+        return MOVE_CASTLE
+    return 0
+
+
+# 기물 구성(material) 키: 킹을 뺀 기물 코드별 개수를 4비트씩 (기물 코드 pc -> 비트 4*pc),
+# 그 위로 비숍 개수를 색 x 칸 색깔별로 4비트씩 (MATERIAL_BISHOP_SHIFT + 4 * (2 * 색 + 어두운 칸)) 더한 정수.
+# 기물을 놓고 뺄 때 MATERIAL_KEYS[기물 코드][칸] 을 더하고 빼기만 하면 됩니다.
+MATERIAL_BISHOP_SHIFT = 64
+
+def is_dark_square(sq):
+    return ((sq >> 3) + sq) & 1
+
+def _material_delta(pc, sq):
+    ptype, color = pc & 7, pc >> 3
+    if ptype in (EMPTY, KING): return 0
+    delta = 1 << (4 * pc)
+    if ptype == BISHOP: delta += 1 << (MATERIAL_BISHOP_SHIFT + 4 * (2 * color + is_dark_square(sq)))
+    return delta
+
+MATERIAL_KEYS = [[_material_delta(pc, sq) for sq in range(64)] for pc in range(16)]
+
+
+# --- 보드 밖 상태를 바이트로 (CompactPosition 과 packed 가 같이 씁니다) ---
+#   0  차례 | 캐슬링 권한 << 1
+#   1  앙파상 파일 + 1 (없으면 0). 앙파상 칸의 줄(row)은 차례로 정해지므로 파일만 저장합니다
+#   2..3  50수 카운트, 4..5  수 번호 (리틀 엔디언, 0xFFFF 에서 멈춤)
+STATE_SIZE = 6
+EP_ROW = (2, 5)  # 차례별 앙파상 칸의 row (백 차례면 흑 폰이 지나간 6랭크)
+
+
+def pack_state(turn, castling, ep_square, halfmove_clock, fullmove_number):
+    return (bytes((turn | (castling << 1), 0 if ep_square is None else (ep_square & 7) + 1))
+            + min(halfmove_clock, 0xFFFF).to_bytes(2, "little")
+            + min(fullmove_number, 0xFFFF).to_bytes(2, "little"))
+
+
+def unpack_state(data):
+    """pack_state 의 반대: (차례, 캐슬링 권한, 앙파상 칸, 50수 카운트, 수 번호)."""
+    turn, ep_file = data[0] & 1, data[1]
+    return (turn, (data[0] >> 1) & 15, EP_ROW[turn] * 8 + ep_file - 1 if ep_file else None,
+            data[2] | (data[3] << 8), data[4] | (data[5] << 8))
+
+
+class Position:
+    """64칸 mailbox 배열 + 기물 코드별 비트보드로 된 국면.
+
+    board[sq] 는 칸의 기물 코드 (64바이트 bytearray), bitboards[기물 코드] 는 그 기물이 있는 칸들의 비트보드,
+    occupied[색] 은 진영별 기물 칸 목록 역할을 하는 비트보드입니다.
+    인스턴스 dict 없이 __slots__ 로만 속성을 가지므로 국면 하나가 작고, copy 는 보드 버퍼 한 번 복사입니다.
+    """
+
+    __slots__ = ("board", "bitboards", "occupied", "king_square", "turn", "castling", "ep_square",
+                 "halfmove_clock", "fullmove_number", "key", "material", "undo_stack")
+
+    def __init__(self):
+        self.board = bytearray(64)
+        self.bitboards = [0] * 16
+        self.occupied = [0, 0]
+        self.king_square = [None, None]
+        self.turn = WHITE
+        self.castling = 0
+        self.ep_square = None  # 앙파상으로 잡을 수 있는 칸
+        self.halfmove_clock = 0
+        self.fullmove_number = 1
+        self.key = 0  # Zobrist 키 (기물을 놓고 빼거나 수를 둘 때마다 갱신)
+        self.material = 0  # 기물 구성 키 (기물을 놓고 뺄 때마다 갱신)
+        # 수마다 64비트 하나: 수 | 잡힌 기물 << 16 | 캐슬링 권한 << 20 | (앙파상 칸 + 1) << 24 | 50수 카운트 << 31
+        self.undo_stack = array("Q")
+
+    @classmethod
+    def start(cls):
+        pos = cls()
+        for col in range(8):
+            pos.put_piece(square(col, 6), make_piece(WHITE, PAWN))
+            pos.put_piece(square(col, 1), make_piece(BLACK, PAWN))
+            pos.put_piece(square(col, 7), make_piece(WHITE, BACK_RANK[col]))
+            pos.put_piece(square(col, 0), make_piece(BLACK, BACK_RANK[col]))
+        pos.castling = ALL_CASTLING
+        pos.key = compute_key(pos)
+        return pos
+
+    @classmethod
+    def from_board(cls, board, turn=WHITE, castling=0, ep_square=None, halfmove_clock=0, fullmove_number=1):
+        """칸별 기물 코드 64바이트로 국면을 만듭니다. 비트보드/키를 기물마다 put_piece 하지 않고 한 번에 채웁니다."""
+        pos = cls()
+        pos.board = bytearray(board)
+        bbs = pos.bitboards
+        piece_keys, material_keys = PIECE_KEYS, MATERIAL_KEYS
+        key = material = 0
+        for sq, pc in enumerate(pos.board):
+            if pc:
+                bbs[pc] |= 1 << sq
+                key ^= piece_keys[pc][sq]
+                material += material_keys[pc][sq]
+        pos.occupied = [bbs[1] | bbs[2] | bbs[3] | bbs[4] | bbs[5] | bbs[6],
+                        bbs[9] | bbs[10] | bbs[11] | bbs[12] | bbs[13] | bbs[14]]
+        pos.king_square = [(b.bit_length() - 1) if b else None for b in (bbs[KING], bbs[8 | KING])]
+        pos.turn = turn
+        pos.castling = castling
+        pos.ep_square = ep_square
+        pos.halfmove_clock = halfmove_clock
+        pos.fullmove_number = fullmove_number
+        key ^= CASTLING_KEYS[castling]
+        if ep_square is not None: key ^= EP_KEYS[ep_square & 7]
+        if turn: key ^= SIDE_KEY
+        pos.key = key
+        pos.material = material
+        return pos
+
+    def copy(self):
+        """국면만 복사합니다. 되돌리기 기록(undo_stack)은 새로 시작합니다."""
+        pos = Position.__new__(Position)
+        pos.board = bytearray(self.board)
+        pos.bitboards = self.bitboards[:]
+        pos.occupied = self.occupied[:]
+        pos.king_square = self.king_square[:]
+        pos.turn = self.turn
+        pos.castling = self.castling
+        pos.ep_square = self.ep_square
+        pos.halfmove_clock = self.halfmove_clock
+        pos.fullmove_number = self.fullmove_number
+        pos.key = self.key
+        pos.material = self.material
+        pos.undo_stack = array("Q")
+        return pos
+
+    def piece_at(self, sq):
+        return self.board[sq]
+
+    def put_piece(self, sq, pc):
+        self.remove_piece(sq)
+        color = piece_color(pc)
+        self.board[sq] = pc
+        self.bitboards[pc] |= 1 << sq
+        self.occupied[color] |= 1 << sq
+        self.key ^= PIECE_KEYS[pc][sq]
+        self.material += MATERIAL_KEYS[pc][sq]
+        if piece_type(pc) == KING:
+            self.king_square[color] = sq
+
+    def remove_piece(self, sq):
+        pc = self.board[sq]
+        if pc:
+            self.board[sq] = EMPTY
+            self.bitboards[pc] ^= 1 << sq
+            self.occupied[piece_color(pc)] ^= 1 << sq
+            self.key ^= PIECE_KEYS[pc][sq]
+            self.material -= MATERIAL_KEYS[pc][sq]
+        return pc
+
+    def move_piece(self, from_sq, to_sq):
+        """from_sq 의 기물을 to_sq 로 옮깁니다. to_sq 에 있던 기물을 돌려줍니다."""
+        captured = self.remove_piece(to_sq)
+        self.put_piece(to_sq, self.remove_piece(from_sq))
+        castling = self.castling & CASTLING_MASK[from_sq] & CASTLING_MASK[to_sq]
+        if castling != self.castling:
+            self.key ^= CASTLING_KEYS[self.castling] ^ CASTLING_KEYS[castling]
+            self.castling = castling
+        return captured
+
+    def pieces(self, color):
+        """(칸, 기물 코드) 를 진영별로 돌려줍니다."""
+        board = self.board
+        result = []
+        b = self.occupied[color]
+        while b:
+            low = b & -b
+            sq = low.bit_length() - 1
+            result.append((sq, board[sq]))
+            b ^= low
+        return result
+
+    def all_occupied(self):
+        return self.occupied[0] | self.occupied[1]
+
+    def make_move(self, move):
+        """수를 그 자리에서 둡니다. unmake_move 로 되돌릴 수 있도록 이전 상태를 undo_stack 에 쌓습니다.
+
+        앙파상/캐슬링/두 칸 전진은 수의 플래그를 보고 처리하므로, 수 생성기가 만든 수(또는 move_flags 로
+        플래그를 붙인 수)를 넘겨야 합니다.
+        """
+        board = self.board
+        from_sq, to_sq, flag = move & 63, (move >> 6) & 63, move >> 12
+        pc = board[from_sq]
+        color = pc >> 3
+        ep = self.ep_square
+        captured = board[to_sq]
+        self.undo_stack.append(move | (captured << 16) | (self.castling << 20)
+                               | ((0 if ep is None else ep + 1) << 24) | (self.halfmove_clock << 31))
+        if ep is not None: self.key ^= EP_KEYS[ep & 7]
+        self.ep_square = None
+        if flag == MOVE_EN_PASSANT:
+            # 잡히는 폰은 도착 칸 바로 뒤에 있습니다.
+            self.remove_piece(to_sq + (8 if color == WHITE else -8))
+            captured = make_piece(color ^ 1, PAWN)
+        elif flag == MOVE_DOUBLE_PUSH:
+            self.ep_square = (from_sq + to_sq) >> 1
+            self.key ^= EP_KEYS[from_sq & 7]
+        elif flag == MOVE_CASTLE:
+            rook_from, rook_to = CASTLING_ROOK[to_sq]
+            self.move_piece(rook_from, rook_to)
+        self.move_piece(from_sq, to_sq)
+        if KNIGHT <= flag <= QUEEN:
+            self.put_piece(to_sq, make_piece(color, flag))
+        self.halfmove_clock = 0 if captured or pc & 7 == PAWN else self.halfmove_clock + 1
+        if color == BLACK: self.fullmove_number += 1
+        self.turn = color ^ 1
+        self.key ^= SIDE_KEY
+
+    def make_null_move(self):
+        """기물을 움직이지 않고 차례만 넘깁니다 (탐색의 null move 가지치기용). unmake_move 로 되돌립니다.
+        되돌리기 기록에는 수 0 (a8 -> a8, 실제로는 나올 수 없는 수) 으로 남깁니다.
+        """
+        ep = self.ep_square
+        self.undo_stack.append((self.castling << 20) | ((0 if ep is None else ep + 1) << 24)
+                               | (self.halfmove_clock << 31))
+        if ep is not None: self.key ^= EP_KEYS[ep & 7]
+        self.ep_square = None
+        self.halfmove_clock += 1
+        if self.turn == BLACK: self.fullmove_number += 1
+        self.turn ^= 1
+        self.key ^= SIDE_KEY
+
+    def unmake_move(self):
+        """마지막 make_move (또는 make_null_move) 를 되돌리고 그 수를 돌려줍니다."""
+        state = self.undo_stack.pop()
+        move = state & 0xFFFF
+        from_sq, to_sq, flag = move & 63, (move >> 6) & 63, move >> 12
+        captured = (state >> 16) & 15
+        color = self.turn ^ 1
+        self.turn = color
+        self.key ^= SIDE_KEY
+        if color == BLACK: self.fullmove_number -= 1
+        castling = (state >> 20) & 15
+        self.key ^= CASTLING_KEYS[self.castling] ^ CASTLING_KEYS[castling]
+        self.castling = castling
+        if self.ep_square is not None: self.key ^= EP_KEYS[self.ep_square & 7]
+        ep = (state >> 24) & 127
+        self.ep_square = ep - 1 if ep else None
+        if ep: self.key ^= EP_KEYS[(ep - 1) & 7]
+        self.halfmove_clock = state >> 31
+        if not move: return move  # null move
+        pc = make_piece(color, PAWN) if KNIGHT <= flag <= QUEEN else self.board[to_sq]
+        self.remove_piece(to_sq)
+        self.put_piece(from_sq, pc)
+        if captured:
+            self.put_piece(to_sq, captured)
+        elif flag == MOVE_EN_PASSANT:
+            self.put_piece(to_sq + (8 if color == WHITE else -8), make_piece(color ^ 1, PAWN))
+        elif flag == MOVE_CASTLE:
+            rook_from, rook_to = CASTLING_ROOK[to_sq]
+            self.put_piece(rook_from, self.remove_piece(rook_to))
+        return move
@@ -0,0 +1,76 @@
+# --- 비트보드 규칙 엔진 ---
+# 공격/체크 판정을 칸을 하나씩 걷는 대신 비트보드 연산으로 계산합니다.
+# 합법 수는 movegen 이 만듭니다.
+
+from .position import (
+    PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING,
+    WHITE_KINGSIDE, WHITE_QUEENSIDE, BLACK_KINGSIDE, BLACK_QUEENSIDE,
+    square,
+)
+from .attacks import (
+    bit, KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, rook_attacks, bishop_attacks, PAWN_PROMOTION_ROW,
+)
+
+PROMOTION_PIECES = (QUEEN, ROOK, BISHOP, KNIGHT)
+
+KINGSIDE = (WHITE_KINGSIDE, BLACK_KINGSIDE)
+QUEENSIDE = (WHITE_QUEENSIDE, BLACK_QUEENSIDE)
+
+
+def _castling_info(color, kingside):
+    """(킹 출발, 킹 도착, 룩 출발, 룩 도착, 비어 있어야 하는 칸, 킹이 지나가는 칸)"""
+    row = 7 if color == 0 else 0
+    if kingside:
+        return (square(4, row), square(6, row), square(7, row), square(5, row),
+                bit(square(5, row)) | bit(square(6, row)),
+                bit(square(4, row)) | bit(square(5, row)) | bit(square(6, row)))
+    return (square(4, row), square(2, row), square(0, row), square(3, row),
+            bit(square(1, row)) | bit(square(2, row)) | bit(square(3, row)),
+            bit(square(4, row)) | bit(square(3, row)) | bit(square(2, row)))
+
+# CASTLING[색][킹 도착 칸] = (권한 비트, 위 정보...)
+CASTLING = ({}, {})
+for _color in (0, 1):
+    for _kingside, _rights in ((True, KINGSIDE[_color]), (False, QUEENSIDE[_color])):
+        _info = _castling_info(_color, _kingside)
+        CASTLING[_color][_info[1]] = (_rights,) + _info
+
+
+def attackers_to(pos, sq, color, occ=None):
+    """color 진영 기물 중 sq 를 공격하는 것들의 비트보드.
+
+    sq 에서 거꾸로 바라봅니다: 나이트/킹 자리, 폰 대각선, 여덟 방향 광선의 첫 번째 기물만 보면 되므로
+    보드 위 기물 수와 상관없이 비용이 일정합니다.
+    """
+    if occ is None: occ = pos.occupied[0] | pos.occupied[1]
+    bbs = pos.bitboards
+    base = color << 3
+    queens = bbs[base | QUEEN]
+    return ((KNIGHT_ATTACKS[sq] & bbs[base | KNIGHT])
+            | (PAWN_ATTACKS[color ^ 1][sq] & bbs[base | PAWN])
+            | (KING_ATTACKS[sq] & bbs[base | KING])
+            | (bishop_attacks(sq, occ) & (bbs[base | BISHOP] | queens))
+            | (rook_attacks(sq, occ) & (bbs[base | ROOK] | queens)))
+
+
+def is_square_attacked(pos, sq, color, occ=None):
+    """color 진영이 sq 를 공격하는지. 가까운 기물부터 확인하고 하나라도 찾으면 바로 끝냅니다."""
+    bbs = pos.bitboards
+    base = color << 3
+    if KNIGHT_ATTACKS[sq] & bbs[base | KNIGHT]: return True
+    if PAWN_ATTACKS[color ^ 1][sq] & bbs[base | PAWN]: return True
+    if KING_ATTACKS[sq] & bbs[base | KING]: return True
+    if occ is None: occ = pos.occupied[0] | pos.occupied[1]
+    queens = bbs[base | QUEEN]
+    if bishop_attacks(sq, occ) & (bbs[base | BISHOP] | queens): return True
+    return bool(rook_attacks(sq, occ) & (bbs[base | ROOK] | queens))
+
+
+def is_in_check(pos, color):
+    k_sq = pos.king_square[color]
+    if k_sq is None: return False
+    return is_square_attacked(pos, k_sq, color ^ 1)
+
+
+def is_promotion(pos, from_sq, to_sq):
+    return pos.board[from_sq] & 7 == PAWN and to_sq >> 3 == PAWN_PROMOTION_ROW[pos.board[from_sq] >> 3]
@@ -0,0 +1,394 @@
+# --- 컴퓨터 상대: 반복 심화 negamax 알파-베타 탐색 ---
+# 깊이 1, 2, 3, ... 순서로 끝까지 탐색하다가 시간/노드 예산이 다 되면 멈추고,
+# 마지막으로 끝까지 마친 깊이의 최선 수를 돌려줍니다. 앞 깊이의 최선 수를 먼저 보므로 다음 깊이의 가지치기가 잘 됩니다.
+# 탐색은 국면 복사본 하나에 make_move / unmake_move 로 내려갔다 올라오고, 예산이 다 되면 예외로 한 번에 빠져나옵니다.
+# 정한 깊이에 닿으면 바로 평가하지 않고 잡는 수만 더 따라가는 정지 탐색(quiescence) 으로 넘어가서,
+# 끝 국면에서 기물이 공짜로 잡히는 상황을 잘못 평가하지 않도록 합니다.
+#
+# 같은 시간에 더 깊이 보기 위한 선택적 탐색 (Engine 옵션으로 하나씩 끌 수 있습니다):
+#   null_move   - 차례를 한 번 넘겨도 (null move) 얕은 탐색에서 beta 이상이면 그 가지는 자릅니다.
+#                 체크 중이거나 킹과 폰만 남은 쪽 (추크추방이 잦은 국면) 에서는 쓰지 않습니다.
+#   lmr         - 순서상 뒤쪽의 조용한 수는 한두 수 얕게 보고, alpha 를 넘을 때만 제 깊이로 다시 봅니다.
+#   pvs         - 첫 수 다음부터는 폭 0 창 (alpha, alpha + 1) 으로 첫 수보다 나은지만 보고, 나을 때만 다시 봅니다.
+#   aspiration  - 앞 깊이 점수 ± ASPIRATION_WINDOW 창으로 뿌리를 탐색하고, 창을 벗어나면 넓혀 다시 봅니다.
+#
+#   python -m chesscore.search --time 5
+#   python -m chesscore.search --depth 4 --fen "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3"
+#   python -m chesscore.search --bench --depth 4        # perft 기준 국면들을 고정 깊이로 (수 순서 효과 측정)
+#   python -m chesscore.search --bench --depth 4 --no-ordering
+
+import argparse
+import sys
+import time
+
+from .position import PAWN, KING, QUEEN, MOVE_DOUBLE_PUSH, MOVE_CASTLE, MOVE_EN_PASSANT
+from .fen import START_FEN, parse_fen
+from .material import is_dead_draw
+from .rules import is_in_check
+from .movegen import generate_legal_moves, generate_captures, move_name
+from .evaluate import evaluate, see
+from .tt import TranspositionTable, BOUND_LOWER, BOUND_UPPER, BOUND_EXACT
+
+INF = 1_000_000
+MATE = 100_000
+MATE_BOUND = MATE - 1000  # 이보다 큰 점수는 메이트까지 남은 수를 담은 점수
+MAX_PLY = 128
+_CHECK_EVERY = 1024  # 이 노드 수마다 시계와 노드 예산을 확인합니다
+ASPIRATION_WINDOW = 50
+NULL_MOVE_MIN_DEPTH = 3
+LMR_MIN_DEPTH = 3
+LMR_MIN_MOVES = 3  # 이만큼의 수를 제 깊이로 본 뒤부터 줄입니다
+
+# --- 수 순서 점수 ---
+# 치환표의 수 > 잡는 수 (MVV-LVA: 값진 기물을 싼 기물로 잡는 수부터) > 킬러 수 2개 > 조용한 수 (history 점수).
+# 수 목록 하나를 정렬할 때 (점수 << 16 | 수) 정수 목록을 한 번에 만들어 sort 하고, 비교 함수는 쓰지 않습니다.
+_HASH_SCORE = 1 << 24
+_CAPTURE_SCORE = 1 << 22
+_KILLER_SCORES = (1 << 21, (1 << 21) - 1)
+_HISTORY_LIMIT = 1 << 20  # history 점수가 이를 넘으면 전체를 반으로 줄입니다
+# [잡히는 기물 코드 << 4 | 움직이는 기물 코드] -> MVV-LVA 점수 (잡는 수가 아니면 0)
+_MVV_LVA = [_CAPTURE_SCORE + (_victim & 7) * 8 - (_attacker & 7) if _victim & 7 else 0
+            for _victim in range(16) for _attacker in range(16)]
+# 수 플래그별 추가 점수: 앙파상은 폰이 폰을 잡는 수, 퀸 승진은 잡는 수만큼 먼저 봅니다.
+_FLAG_SCORES = [0] * 16
+_FLAG_SCORES[MOVE_EN_PASSANT] = _CAPTURE_SCORE + PAWN * 8 - PAWN
+_FLAG_SCORES[QUEEN] = _CAPTURE_SCORE + QUEEN * 8
+_QUIET_FLAGS = (0, MOVE_DOUBLE_PUSH, MOVE_CASTLE)
+
+
+class SearchResult:
+    """탐색 결과. 예산 안에서 끝까지 마친 마지막 깊이 기준입니다.
+
+    move: 최선 수 (합법 수가 없으면 None)
+    score: 차례인 쪽에서 본 점수 (센티폰, 메이트는 ±(MATE - 수))
+    depth: 끝까지 마친 깊이
+    nodes, time: 탐색한 노드 수와 걸린 시간(초) - 멈춘 깊이의 것까지 포함
+    pv: 예상 수순
+    """
+
+    def __init__(self, move, score, depth, nodes, time, pv):
+        self.move = move
+        self.score = score
+        self.depth = depth
+        self.nodes = nodes
+        self.time = time
+        self.pv = pv
+
+    def __repr__(self):
+        pv = " ".join(move_name(m) for m in self.pv)
+        return f"SearchResult(depth={self.depth}, score={self.score}, nodes={self.nodes}, pv={pv!r})"
+
+
+class _Stop(Exception):
+    """예산이 다 되어 탐색을 멈출 때 던집니다."""
+
+
+def allot_time(remaining, max_time=5.0):
+    """남은 시계(초)에서 이번 수에 쓸 시간. 남은 시간의 1/40, 최대 max_time 초."""
+    return max(0.05, min(remaining / 40, max_time))
+
+
+def _score_to_tt(score, ply):
+    """메이트 점수는 뿌리가 아닌 그 노드 기준 (메이트까지 남은 수) 으로 저장합니다."""
+    if score >= MATE_BOUND: return score + ply
+    if score <= -MATE_BOUND: return score - ply
+    return score
+
+
+def _score_from_tt(score, ply):
+    if score >= MATE_BOUND: return score - ply
+    if score <= -MATE_BOUND: return score + ply
+    return score
+
+
+class Engine:
+    def __init__(self, hash_mb=16, ordering=True, quiescence=True, null_move=True, lmr=True, pvs=True,
+                 aspiration=True):
+        """hash_mb: 치환표 크기 (메가바이트). 치환표는 수를 둘 때마다 비우지 않고 이어서 씁니다.
+        ordering=False 이면 수 순서를 정하지 않고 생성 순서대로 봅니다 (효과 측정용).
+        quiescence=False 이면 정한 깊이에서 바로 평가합니다.
+        null_move / lmr / pvs / aspiration: 맨 위 설명의 선택적 탐색을 각각 켜고 끕니다.
+        """
+        self.nodes = 0
+        self.pos = None
+        self.tt = TranspositionTable(hash_mb)
+        self.ordering = ordering
+        self.quiescence = quiescence
+        self.null_move = null_move
+        self.lmr = lmr
+        self.pvs = pvs
+        self.aspiration = aspiration
+        self.history = [0] * (2 * 4096)  # [차례 << 12 | 출발 칸 | 도착 칸 << 6] 조용한 수가 컷을 낸 깊이^2 합
+
+    def search(self, pos, max_time=None, max_nodes=None, max_depth=MAX_PLY - 1, history=(), info=None):
+        """pos 에서 둘 수를 고릅니다. pos 는 바꾸지 않습니다.
+
+        max_time (초) / max_nodes 중 먼저 닿는 쪽에서 멈춥니다. 둘 다 없으면 max_depth 까지 탐색합니다.
+        history: 게임에서 이미 나온 국면 키들 (Game.repetitions.counts 등). 이 국면으로 돌아가는 수는 무승부로 봅니다.
+        info: 깊이 하나를 마칠 때마다 SearchResult 를 받아 부를 함수.
+        """
+        self.pos = pos = pos.copy()
+        self.nodes = 0
+        self.start = time.perf_counter()
+        self.deadline = None if max_time is None else self.start + max_time
+        self.max_nodes = max_nodes
+        self._check_at = _CHECK_EVERY if max_nodes is None else min(_CHECK_EVERY, max_nodes)
+        self.game_keys = set(history)
+        self.game_keys.discard(pos.key)
+        self.path = []  # 뿌리부터 지금 노드 바로 위까지의 국면 키 (반복 판정)
+        self.pv = [[] for _ in range(MAX_PLY + 1)]
+        self.killers = [[0, 0] for _ in range(MAX_PLY + 1)]
+        self.cutoffs = self.first_move_cutoffs = 0
+        self.tt.new_search()
+        self.tt.reset_stats()
+
+        entry = self.tt.probe(pos.key)
+        self.root_moves = self._order_moves(generate_legal_moves(pos), 0, entry[3] if entry else 0)
+        if not self.root_moves:
+            score = -MATE if is_in_check(pos, pos.turn) else 0
+            return SearchResult(None, score, 0, 0, 0.0, [])
+        result = SearchResult(self.root_moves[0], 0, 0, 0, 0.0, [self.root_moves[0]])
+        for depth in range(1, max_depth + 1):
+            try:
+                score = self._search_root(depth, result.score)
+            except _Stop:
+                break
+            pv = self.pv[0]
+            result = SearchResult(pv[0], score, depth, self.nodes, time.perf_counter() - self.start, list(pv))
+            if info: info(result)
+            # 다음 깊이는 이번 최선 수부터 봅니다.
+            self.root_moves.remove(pv[0]); self.root_moves.insert(0, pv[0])
+            if len(self.root_moves) == 1 or abs(score) >= MATE_BOUND: break
+            # 다음 깊이는 보통 지금까지보다 오래 걸리므로 예산의 절반을 넘겼으면 시작하지 않습니다.
+            if self.deadline is not None and time.perf_counter() - self.start > (self.deadline - self.start) / 2: break
+        result.nodes, result.time = self.nodes, time.perf_counter() - self.start
+        return result
+
+    def choose_move(self, game, max_time=None, max_nodes=None, **kwargs):
+        """Game 의 현재 국면에서 search. 반복 무승부 판정에 게임 기록을 씁니다."""
+        return self.search(game.position, max_time, max_nodes, history=game.repetitions.counts, **kwargs)
+
+    def _check_limits(self):
+        if self.max_nodes is not None and self.nodes >= self.max_nodes: raise _Stop
+        if self.deadline is not None and time.perf_counter() >= self.deadline: raise _Stop
+        self._check_at = self.nodes + _CHECK_EVERY
+        if self.max_nodes is not None: self._check_at = min(self._check_at, self.max_nodes)
+
+    @property
+    def first_move_cutoff_rate(self):
+        """beta 컷 중 첫 수에서 난 비율. 수 순서가 좋을수록 1 에 가깝습니다."""
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+
+    def _order_moves(self, moves, ply, hash_move):
+        """수 목록을 점수 순서로 정렬한 list. 점수는 목록 전체를 한 번에 계산합니다."""
+        if not self.ordering: return list(moves)
+        board = self.pos.board
+        special = {hash_move: _HASH_SCORE}
+        killer1, killer2 = self.killers[ply]
+        if killer1: special.setdefault(killer1, _KILLER_SCORES[0])
+        if killer2: special.setdefault(killer2, _KILLER_SCORES[1])
+        get, mvv_lva, flags = special.get, _MVV_LVA, _FLAG_SCORES
+        history, side = self.history, self.pos.turn << 12
+        keys = [(get(m) or mvv_lva[board[(m >> 6) & 63] << 4 | board[m & 63]] + flags[m >> 12]
+                 or history[side | m & 4095]) << 16 | m for m in moves]
+        keys.sort(reverse=True)
+        return [key & 0xFFFF for key in keys]
+
+    def _record_cutoff(self, move, ply, depth):
+        """조용한 수가 beta 컷을 내면 킬러와 history 에 기록합니다."""
+        killers = self.killers[ply]
+        if killers[0] != move: killers[1], killers[0] = killers[0], move
+        history = self.history
+        i = self.pos.turn << 12 | move & 4095
+        history[i] += depth * depth
+        if history[i] > _HISTORY_LIMIT: self.history = [h >> 1 for h in history]
+
+    @staticmethod
+    def _has_pieces(pos):
+        """차례인 쪽에 킹과 폰 말고 다른 기물이 있는지 (없으면 추크추방이 잦아 null move 를 쓰지 않습니다)."""
+        bbs, base = pos.bitboards, pos.turn << 3
+        return bool(pos.occupied[pos.turn] & ~(bbs[base | PAWN] | bbs[base | KING]))
+
+    def _is_draw(self, pos):
+        key = pos.key
+        return (pos.halfmove_clock >= 100 or key in self.path or key in self.game_keys
+                or is_dead_draw(pos.material))
+
+    def _search_root(self, depth, previous):
+        """뿌리 탐색. aspiration 이면 앞 깊이 점수 둘레의 좁은 창부터 보고, 벗어난 쪽으로 창을 넓혀 가며 다시 봅니다."""
+        if not self.aspiration or depth == 1 or abs(previous) >= MATE_BOUND:
+            return self._negamax(depth, -INF, INF, 0)
+        window = ASPIRATION_WINDOW
+        alpha, beta = previous - window, previous + window
+        while True:
+            score = self._negamax(depth, alpha, beta, 0)
+            if score <= alpha: alpha = max(-INF, alpha - window)
+            elif score >= beta: beta = min(INF, beta + window)
+            else: return score
+            window *= 4
+
+    def _negamax(self, depth, alpha, beta, ply, null_ok=True):
+        pos = self.pos
+        pv = self.pv
+        pv[ply] = []
+        if ply:
+            if self._is_draw(pos): return 0
+            if depth <= 0: return self._quiesce(alpha, beta, ply)
+        self.nodes += 1
+        if self.nodes >= self._check_at: self._check_limits()
+        in_check = is_in_check(pos, pos.turn)
+        if ply:
+            if ply >= MAX_PLY: return evaluate(pos)
+            hash_move = 0
+            entry = self.tt.probe(pos.key)
+            if entry is not None:
+                tt_depth, bound, score, hash_move = entry
+                if tt_depth >= depth:
+                    score = _score_from_tt(score, ply)
+                    if (bound == BOUND_EXACT or bound == BOUND_LOWER and score >= beta
+                            or bound == BOUND_UPPER and score <= alpha):
+                        return score
+            if (self.null_move and null_ok and not in_check and depth >= NULL_MOVE_MIN_DEPTH
+                    and self._has_pieces(pos) and evaluate(pos) >= beta):
+                # 상대에게 한 수를 거저 줘도 beta 이상이면, 실제로 두면 더 좋을 것이므로 자릅니다.
+                reduction = 3 if depth > 6 else 2
+                pos.make_null_move()
+                score = -self._negamax(depth - 1 - reduction, -beta, -beta + 1, ply + 1, False)
+                pos.unmake_move()
+                if score >= beta: return beta if score >= MATE_BOUND else score
+            moves = generate_legal_moves(pos)
+            if not moves:
+                return -MATE + ply if in_check else 0
+            moves = self._order_moves(moves, ply, hash_move)
+        else:
+            moves = self.root_moves
+
+        alpha_orig = alpha
+        best, best_move = -INF, 0
+        board = pos.board
+        killers = self.killers[ply]
+        reduce_late = self.lmr and depth >= LMR_MIN_DEPTH and not in_check
+        self.path.append(pos.key)
+        for i, move in enumerate(moves):
+            quiet = not board[(move >> 6) & 63] and (move >> 12) in _QUIET_FLAGS
+            pos.make_move(move)
+            if i == 0:
+                score = -self._negamax(depth - 1, -beta, -alpha, ply + 1)
+            else:
+                # 늦은 조용한 수 (킬러, 체크를 거는 수 제외) 는 줄인 깊이로 먼저 봅니다.
+                reduction = 0
+                if (reduce_late and quiet and i >= LMR_MIN_MOVES and move not in killers
+                        and not is_in_check(pos, pos.turn)):
+                    reduction = 1 if i < 2 * LMR_MIN_MOVES else 2
+                full = True
+                if reduction:
+                    score = -self._negamax(depth - 1 - reduction, -alpha - 1 if self.pvs else -beta, -alpha, ply + 1)
+                    full = score > alpha
+                if full and self.pvs:
+                    score = -self._negamax(depth - 1, -alpha - 1, -alpha, ply + 1)
+                    full = alpha < score < beta
+                if full:
+                    score = -self._negamax(depth - 1, -beta, -alpha, ply + 1)
+            pos.unmake_move()
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha, best_move = score, move
+                    pv[ply] = [move] + pv[ply + 1]
+                    if alpha >= beta:
+                        self.cutoffs += 1
+                        if i == 0: self.first_move_cutoffs += 1
+                        if quiet: self._record_cutoff(move, ply, depth)
+                        break
+        self.path.pop()
+        bound = BOUND_LOWER if best >= beta else BOUND_UPPER if best <= alpha_orig else BOUND_EXACT
+        self.tt.store(pos.key, depth, bound, _score_to_tt(best, ply), best_move)
+        return best
+
+    def _quiesce(self, alpha, beta, ply):
+        """잡는 수만 보는 탐색. 차례인 쪽은 잡지 않고 멈출 수도 있으므로 (stand pat) 정적 평가가 하한입니다.
+        SEE 로 손해 보는 잡는 수는 보지 않습니다. 체크 중이면 멈출 수 없으니 체크를 피하는 수를 모두 봅니다.
+        """
+        self.nodes += 1
+        if self.nodes >= self._check_at: self._check_limits()
+        pos = self.pos
+        if not self.quiescence or ply >= MAX_PLY: return evaluate(pos)
+        in_check = is_in_check(pos, pos.turn)
+        if in_check:
+            best = -INF
+            moves = generate_legal_moves(pos)
+            if not moves: return -MATE + ply
+        else:
+            best = evaluate(pos)
+            if best >= beta: return best
+            if best > alpha: alpha = best
+            moves = generate_captures(pos)
+        for move in self._order_moves(moves, ply, 0):
+            if not in_check and see(pos, move) < 0: continue
+            pos.make_move(move)
+            score = -self._quiesce(-beta, -alpha, ply + 1)
+            pos.unmake_move()
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta: break
+        return best
+
+
+def bench(depth, out=sys.stdout, **options):
+    """perft 기준 국면들을 고정 깊이까지 탐색해 노드 수와 첫 수 컷 비율을 출력합니다. options 는 Engine 으로."""
+    from .perft import REFERENCE_POSITIONS
+
+    total_nodes, total_time, cutoffs, first = 0, 0.0, 0, 0
+    for name, fen, _ in REFERENCE_POSITIONS:
+        engine = Engine(**options)
+        result = engine.search(parse_fen(fen), max_depth=depth)
+        total_nodes += result.nodes; total_time += result.time
+        cutoffs += engine.cutoffs; first += engine.first_move_cutoffs
+        print(f"{name:<18} depth {result.depth}  nodes {result.nodes:>9}  {result.time:7.2f}s  "
+              f"first-move cutoffs {engine.first_move_cutoff_rate:6.1%}  best {move_name(result.move)}", file=out)
+    print(f"total nodes {total_nodes}  {total_time:.2f}s  first-move cutoffs {first / (cutoffs or 1):.1%}", file=out)
+    return total_nodes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m chesscore.search", description="엔진 탐색")
+    parser.add_argument("--fen", default=START_FEN)
+    parser.add_argument("--time", type=float, help="생각할 시간(초)")
+    parser.add_argument("--nodes", type=int, help="최대 노드 수")
+    parser.add_argument("--depth", type=int, default=MAX_PLY - 1, help="최대 깊이")
+    parser.add_argument("--hash", type=int, default=16, help="치환표 크기 (MB)")
+    parser.add_argument("--bench", action="store_true", help="perft 기준 국면들을 --depth 까지 (기본 4)")
+    parser.add_argument("--no-ordering", dest="ordering", action="store_false", help="수 순서 정하기 끄기")
+    parser.add_argument("--no-quiescence", dest="quiescence", action="store_false", help="정지 탐색 끄기")
+    parser.add_argument("--no-null-move", dest="null_move", action="store_false", help="null move 가지치기 끄기")
+    parser.add_argument("--no-lmr", dest="lmr", action="store_false", help="늦은 수 줄이기 끄기")
+    parser.add_argument("--no-pvs", dest="pvs", action="store_false", help="PVS (폭 0 창 탐색) 끄기")
+    parser.add_argument("--no-aspiration", dest="aspiration", action="store_false", help="aspiration 창 끄기")
+    args = parser.parse_args(argv)
+    options = {name: getattr(args, name)
+               for name in ("ordering", "quiescence", "null_move", "lmr", "pvs", "aspiration")}
+    options["hash_mb"] = args.hash
+    if args.bench:
+        bench(4 if args.depth == MAX_PLY - 1 else args.depth, **options)
+        return 0
+    if args.time is None and args.nodes is None and args.depth == MAX_PLY - 1: args.time = 5.0
+
+    def info(r):
+        nps = r.nodes / r.time if r.time > 0 else 0
+        print(f"depth {r.depth:>2}  score {r.score:>6}  nodes {r.nodes:>9}  {r.time:7.2f}s {nps:>8.0f} nps  "
+              f"pv {' '.join(move_name(m) for m in r.pv)}")
+
+    engine = Engine(**options)
+    result = engine.search(parse_fen(args.fen), args.time, args.nodes, args.depth, info=info)
+    print(f"bestmove {move_name(result.move) if result.move is not None else '(none)'}  "
+          f"first-move cutoffs {engine.first_move_cutoff_rate:.1%}")
+    tt = engine.tt.stats()
+    print(f"hash {tt['size_mb']:.0f}MB  entries {tt['entries']}  hit {tt['hit_rate']:.1%}  "
+          f"collision {tt['collision_rate']:.1%}  replaced {tt['replacements']}  fill {tt['fill_rate']:.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
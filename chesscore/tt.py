@@ -0,0 +1,93 @@
+# --- 치환표 (transposition table) ---
+# 탐색은 다른 수순으로 같은 국면에 여러 번 닿습니다. 국면의 Zobrist 키로 앞서 구한 결과를 찾아 다시 쓰도록
+# (깊이, 점수의 종류, 점수, 최선 수, 세대) 를 미리 잡아 둔 array('Q') 한 덩어리에 담습니다.
+#
+# 버킷 하나 = 항목 2개 = 8바이트 정수 4개 (32바이트): [키0, 데이터0, 키1, 데이터1]
+#   항목 0: 깊이 우선 - 더 깊게 (또는 같은 국면을 / 지난 탐색 세대를) 탐색한 결과만 덮어씁니다
+#   항목 1: 항상 교체 - 항목 0 에 못 들어간 결과는 여기에 씁니다
+# 데이터: 수 16비트 | 깊이 8비트 << 16 | 종류 8비트 << 24 | 세대 8비트 << 32 | (점수 + 2^23) 24비트 << 40
+# 키 전체를 같이 저장하므로 버킷 번호만 같은 다른 국면은 구분됩니다. 키 0 은 빈 칸입니다.
+
+from array import array
+
+BOUND_LOWER = 1  # 점수 >= 저장된 값 (beta 컷)
+BOUND_UPPER = 2  # 점수 <= 저장된 값 (모든 수가 alpha 이하)
+BOUND_EXACT = 3
+
+BUCKET_BYTES = 32
+_SCORE_OFFSET = 1 << 23
+
+
+class TranspositionTable:
+    def __init__(self, size_mb=16):
+        """size_mb 메가바이트 안에 들어가는 가장 큰 2의 거듭제곱 개의 버킷을 잡습니다."""
+        buckets = max(1, size_mb * (1 << 20) // BUCKET_BYTES)
+        buckets = 1 << (buckets.bit_length() - 1)
+        self.mask = buckets - 1
+        self.table = array("Q", bytes(buckets * BUCKET_BYTES))
+        self.age = 0
+        self.reset_stats()
+
+    @property
+    def size_bytes(self):
+        return len(self.table) * self.table.itemsize
+
+    @property
+    def capacity(self):
+        """항목 수 (버킷 수 x 2)."""
+        return len(self.table) // 2
+
+    def clear(self):
+        self.table = array("Q", bytes(self.size_bytes))
+        self.age = 0
+        self.reset_stats()
+
+    def new_search(self):
+        """탐색을 시작할 때마다 부릅니다. 지난 탐색들의 항목은 깊이와 상관없이 교체 대상이 됩니다."""
+        self.age = (self.age + 1) & 0xFF
+
+    def reset_stats(self):
+        self.probes = self.hits = self.collisions = self.stores = self.replacements = 0
+
+    def probe(self, key):
+        """(깊이, 종류, 점수, 수) 또는 None."""
+        self.probes += 1
+        table = self.table
+        i = (key & self.mask) << 2
+        if table[i] == key: data = table[i + 1]
+        elif table[i + 2] == key: data = table[i + 3]
+        else:
+            if table[i] or table[i + 2]: self.collisions += 1  # 버킷은 찼는데 다른 국면들
+            return None
+        self.hits += 1
+        return (data >> 16) & 0xFF, (data >> 24) & 0xFF, (data >> 40) - _SCORE_OFFSET, data & 0xFFFF
+
+    def store(self, key, depth, bound, score, move):
+        self.stores += 1
+        table = self.table
+        i = (key & self.mask) << 2
+        old_key = table[i]
+        if old_key and old_key != key:
+            old = table[i + 1]
+            if (old >> 16) & 0xFF > depth and (old >> 32) & 0xFF == self.age:
+                i += 2  # 깊이 우선 항목이 더 값지면 항상 교체 항목에 씁니다
+                old_key = table[i]
+        if old_key == key:
+            if not move: move = table[i + 1] & 0xFFFF  # 최선 수를 모르는 결과 (fail-low) 라도 전에 찾은 수는 남깁니다
+        elif old_key:
+            self.replacements += 1
+        table[i] = key
+        table[i + 1] = (move | max(0, min(depth, 0xFF)) << 16 | bound << 24 | self.age << 32
+                        | (score + _SCORE_OFFSET) << 40)
+
+    def fill_rate(self, sample=4000):
+        """앞쪽 sample 개 항목 중 이번 세대에 쓰인 비율 (전체를 세려면 sample=None)."""
+        data = self.table[1::2] if sample is None else self.table[1:2 * sample:2]
+        age = self.age
+        return sum(1 for d in data if d and (d >> 32) & 0xFF == age) / len(data)
+
+    def stats(self):
+        probes = self.probes or 1
+        return {"size_mb": self.size_bytes / (1 << 20), "entries": self.capacity, "probes": self.probes,
+                "hit_rate": self.hits / probes, "collision_rate": self.collisions / probes,
+                "stores": self.stores, "replacements": self.replacements, "fill_rate": self.fill_rate()}
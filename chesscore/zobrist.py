@@ -0,0 +1,56 @@
+# --- Zobrist 해시 ---
+# 국면마다 64비트 정수 키 하나. 기물/캐슬링 권한/앙파상 파일/차례마다 난수를 정해 두고 XOR 로 합칩니다.
+# 수를 둘 때 바뀐 부분의 난수만 XOR 하면 되므로 국면 전체를 다시 훑을 필요가 없습니다.
+
+_MASK64 = (1 << 64) - 1
+_state = 20240119  # 실행할 때마다 같은 키가 나오도록 고정된 시드
+
+
+def _next_key():
+    """splitmix64 난수. random 모듈을 불러오지 않아 import 가 가볍습니다."""
+    global _state
+    _state = (_state + 0x9E3779B97F4A7C15) & _MASK64
+    z = _state
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+PIECE_KEYS = [[_next_key() for _ in range(64)] for _ in range(16)]
+CASTLING_KEYS = [0] + [_next_key() for _ in range(15)]
+EP_KEYS = [_next_key() for _ in range(8)]  # 앙파상 칸의 파일(col)별
+SIDE_KEY = _next_key()  # 흑 차례일 때 XOR
+
+
+def compute_key(pos):
+    """국면의 키를 처음부터 계산합니다. 수를 둘 때는 Position 이 키를 직접 갱신합니다."""
+    key = 0
+    for sq, pc in enumerate(pos.board):
+        if pc: key ^= PIECE_KEYS[pc][sq]
+    key ^= CASTLING_KEYS[pos.castling]
+    if pos.ep_square is not None: key ^= EP_KEYS[pos.ep_square & 7]
+    if pos.turn: key ^= SIDE_KEY
+    return key
+
+
+class RepetitionTable:
+    """키 -> 나온 횟수.
+
+    캡처나 폰 이동(되돌릴 수 없는 수) 이전의 국면은 다시 나올 수 없으므로,
+    그런 수가 나오면 표를 비웁니다. 그래서 표에는 마지막 캡처/폰 이동 이후의 국면만 남습니다.
+    """
+
+    def __init__(self):
+        self.counts = {}
+
+    def clear(self):
+        self.counts.clear()
+
+    def push(self, key, irreversible=False):
+        if irreversible: self.counts.clear()
+        count = self.counts.get(key, 0) + 1
+        self.counts[key] = count
+        return count
+
+    def count(self, key):
+        return self.counts.get(key, 0)